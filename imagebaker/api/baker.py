@@ -407,7 +407,7 @@ class ImageBaker:
         Returns:
             Numpy array with shape (H, W, C)
         """
-        return qpixmap_to_numpy(QPixmap.fromImage(result.image))
+        return qpixmap_to_numpy(result.image)
 
     def get_layer_count(self) -> int:
         """Get the number of layers."""
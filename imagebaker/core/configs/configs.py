@@ -114,6 +114,8 @@ class LayerConfig(BaseConfig):
     # whether to search image in subfolders as well
     full_search: bool = False
     cleanup_on_exit: bool = False
+    # number of decoded neighbour images kept around for fast navigation
+    preload_cache_size: int = 4
 
     def get_label_color(self, label):
         for lbl in self.predefined_labels:
@@ -138,6 +140,8 @@ class CanvasConfig(BaseConfig):
     write_masks: bool = True
     fps: int = 5
     max_edge_width: int = 100
+    # longest side (in pixels) a state is rendered at before scaling to a thumbnail
+    state_thumbnail_source_size: int = 200
 
     @property
     def export_folder(self):
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +9,11 @@ from pydantic import BaseModel
 from PySide6.QtCore import QPointF, QRectF
 from PySide6.QtGui import QColor, QImage, QPolygonF
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None
+
 
 class MouseMode(Enum):
     IDLE = 0
@@ -32,7 +38,8 @@ class ModelType(str, Enum):
     PROMPT = "prompt"
 
 
-@dataclass
+# slots: animations build one of these per stroke for every interpolated step
+@dataclass(slots=True)
 class DrawingState:
     position: QPointF = field(default_factory=lambda: QPointF(0, 0))
     color: QColor = field(default_factory=lambda: QColor(255, 255, 255))
@@ -55,7 +62,9 @@ class PredictionResult(BaseModel):
         arbitrary_types_allowed = True
 
 
-@dataclass
+# slots: one instance per interpolated animation step, see
+# utils.state_utils.calculate_intermediate_states
+@dataclass(slots=True)
 class LayerState:
     layer_id: str = ""
     state_step: int = 0
@@ -79,6 +88,28 @@ class LayerState:
     edge_width: int = 10
     caption: str = ""
 
+    def to_vec(self) -> np.ndarray:
+        """
+        The interpolated numeric fields as one float64 array.
+
+        The order is opacity, rotation, scale, scale_x, scale_y, position x
+        and y, transform_origin x and y, edge_opacity and edge_width.
+        """
+        return np.array(
+            [
+                self.opacity,
+                self.rotation,
+                self.scale,
+                self.scale_x,
+                self.scale_y,
+                *self.position.toTuple(),
+                *self.transform_origin.toTuple(),
+                self.edge_opacity,
+                self.edge_width,
+            ],
+            dtype=np.float64,
+        )
+
     def copy(self):
         return LayerState(
             layer_id=self.layer_id,
@@ -119,6 +150,32 @@ class Label:
     color: QColor = field(default_factory=lambda: QColor(255, 255, 255))
 
 
+def qpointlist_to_ndarray(points: list[QPointF] | QPolygonF) -> np.ndarray:
+    """
+    Convert a sequence of QPointF to a float32 numpy array.
+
+    Args:
+        points: List of QPointF or a QPolygonF
+
+    Returns:
+        numpy.ndarray: Array with shape (len(points), 2) containing x, y values
+    """
+    # toTuple reads both coordinates in one call into Qt instead of two
+    return np.fromiter(
+        chain.from_iterable(p.toTuple() for p in points),
+        dtype=np.float32,
+        count=2 * len(points),
+    ).reshape(-1, 2)
+
+
+# geometry field -> the cache it invalidates when assigned, see Annotation
+_GEOMETRY_CACHES = {
+    "points": "_points_cache",
+    "polygon": "_polygon_cache",
+    "rectangle": "_rectangle_cache",
+}
+
+
 @dataclass
 class Annotation:
     annotation_id: int
@@ -141,6 +198,65 @@ class Annotation:
     is_model_generated: bool = False
     model_name: str = None
     caption: str = ""
+    # arrays behind points_array, polygon_array and rectangle_xyxy, dropped
+    # whenever the matching geometry field is assigned
+    _points_cache: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _polygon_cache: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _rectangle_cache: np.ndarray | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name, value):
+        cache = _GEOMETRY_CACHES.get(name)
+        if cache is not None:
+            object.__setattr__(self, cache, None)
+        object.__setattr__(self, name, value)
+
+    def geometry_changed(self):
+        """
+        Drop the cached geometry arrays.
+
+        Assigning points, polygon or rectangle does this already, call it after
+        editing one of them in place, e.g. moving a polygon vertex.
+        """
+        self._points_cache = None
+        self._polygon_cache = None
+        self._rectangle_cache = None
+
+    def points_array(self) -> np.ndarray | None:
+        """
+        The points as a float32 (N, 2) array.
+
+        The array is built once and reused until points is assigned again or
+        geometry_changed is called.
+        """
+        if not self.points:
+            return None
+        if self._points_cache is None:
+            self._points_cache = qpointlist_to_ndarray(self.points)
+        return self._points_cache
+
+    def polygon_array(self) -> np.ndarray | None:
+        """The polygon as a float32 (N, 2) array, cached like points_array."""
+        if not self.polygon:
+            return None
+        if self._polygon_cache is None:
+            self._polygon_cache = qpointlist_to_ndarray(self.polygon)
+        return self._polygon_cache
+
+    def rectangle_xyxy(self) -> np.ndarray | None:
+        """The rectangle as a float32 x1, y1, x2, y2 array, cached like points_array."""
+        if not self.rectangle:
+            return None
+        if self._rectangle_cache is None:
+            self._rectangle_cache = np.array(
+                self.rectangle.getCoords(), dtype=np.float32
+            )
+        return self._rectangle_cache
 
     def copy(self):
         import numpy as np
@@ -194,7 +310,11 @@ class Annotation:
                 points = [[p.x(), p.y()] for p in annotation.points]
             mask = None
             if annotation.mask is not None:
-                mask = np.asarray(annotation.mask).tolist()
+                if orjson is not None:
+                    # orjson writes contiguous arrays without a list round trip
+                    mask = np.ascontiguousarray(annotation.mask)
+                else:
+                    mask = np.asarray(annotation.mask).tolist()
             data = {
                 "annotation_id": annotation.annotation_id,
                 "label": annotation.label,
@@ -216,6 +336,11 @@ class Annotation:
             }
             annotations_dict.append(data)
 
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(annotations_dict, option=option))
+            return
         with open(path, "w") as f:
             json.dump(annotations_dict, f, indent=4)
 
@@ -228,8 +353,12 @@ class Annotation:
         if not Path(path).exists():
             return []
 
-        with open(path) as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path) as f:
+                data = json.load(f)
 
         annotations = []
         for d in data:
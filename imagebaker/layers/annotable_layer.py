@@ -22,7 +22,6 @@ from PySide6.QtGui import (
     QWheelEvent,
 )
 from PySide6.QtWidgets import (
-    QApplication,
     QInputDialog,
     QMessageBox,
     QProgressDialog,
@@ -39,7 +38,8 @@ from imagebaker.workers import LayerifyWorker
 
 class AnnotableLayer(BaseLayer):
     annotationAdded = Signal(Annotation)
-    annotationRemoved = Signal()
+    # first annotation index whose row changed, everything before it is intact
+    annotationRemoved = Signal(int)
     annotationUpdated = Signal(Annotation)
     annotationCleared = Signal()
     annotationMoved = Signal()
@@ -91,7 +91,7 @@ class AnnotableLayer(BaseLayer):
             return
         self._redo_stack.append(self._snapshot_annotations())
         self._restore_annotations(self._undo_stack.pop())
-        self.annotationRemoved.emit()
+        self.annotationRemoved.emit(0)
         self.messageSignal.emit("Undo applied.")
 
     def redo(self):
@@ -100,7 +100,7 @@ class AnnotableLayer(BaseLayer):
             return
         self._undo_stack.append(self._snapshot_annotations())
         self._restore_annotations(self._redo_stack.pop())
-        self.annotationRemoved.emit()
+        self.annotationRemoved.emit(0)
         self.messageSignal.emit("Redo applied.")
 
     def init_ui(self):
@@ -245,18 +245,45 @@ class AnnotableLayer(BaseLayer):
             self.messageSignal.emit("No annotation selected to delete.")
             return
 
-        selected_ids = {id(ann) for ann in selected_annotations}
         removed_count = len(selected_annotations)
-        self.annotations = [
-            ann for ann in self.annotations if id(ann) not in selected_ids
-        ]
+        if removed_count == 1:
+            # annotation_id tracks the list position, so a single deletion is
+            # a del at that index, only ids after it need renumbering
+            target = selected_annotations[0]
+            first_index = target.annotation_id
+            if not (
+                0 <= first_index < len(self.annotations)
+                and self.annotations[first_index] is target
+            ):
+                first_index = next(
+                    (i for i, ann in enumerate(self.annotations) if ann is target),
+                    len(self.annotations),
+                )
+            del self.annotations[first_index : first_index + 1]
+        else:
+            # everything before the first deleted annotation stays in place,
+            # so only the tail is filtered and the list refresh starts there
+            selected_ids = {id(ann) for ann in selected_annotations}
+            first_index = next(
+                (
+                    i
+                    for i, ann in enumerate(self.annotations)
+                    if id(ann) in selected_ids
+                ),
+                len(self.annotations),
+            )
+            self.annotations[first_index:] = [
+                ann
+                for ann in self.annotations[first_index:]
+                if id(ann) not in selected_ids
+            ]
 
-        for index, annotation in enumerate(self.annotations):
-            annotation.annotation_id = index
+        for index in range(first_index, len(self.annotations)):
+            self.annotations[index].annotation_id = index
 
         self.selected_annotation = None
         self.current_annotation = None
-        self.annotationRemoved.emit()
+        self.annotationRemoved.emit(first_index)
         self.messageSignal.emit(f"Deleted {removed_count} annotation(s)")
         self.update()
 
@@ -776,8 +803,10 @@ class AnnotableLayer(BaseLayer):
                     self.selected_annotation.polygon[self.active_point_index] = (
                         clamped_pos
                     )
+                    self.selected_annotation.geometry_changed()
                 elif self.selected_annotation.points:
                     self.selected_annotation.points[0] = clamped_pos
+                    self.selected_annotation.geometry_changed()
                 self.annotationMoved.emit()
                 self.annotationUpdated.emit(self.selected_annotation)
                 self.update()
@@ -807,8 +836,10 @@ class AnnotableLayer(BaseLayer):
 
         if annotation.rectangle:
             annotation.rectangle.translate(delta)
+            annotation.geometry_changed()
         elif annotation.polygon:
             annotation.polygon.translate(delta)
+            annotation.geometry_changed()
         elif annotation.points:
             annotation.points = [p + delta for p in annotation.points]
 
@@ -966,6 +997,7 @@ class AnnotableLayer(BaseLayer):
                     logger.info(f"Adding point to polygon: {clamped_pos}")
                     # Add point to polygon
                     self.current_annotation.polygon.append(clamped_pos)
+                    self.current_annotation.geometry_changed()
 
             self.update()
 
@@ -1242,6 +1274,13 @@ class AnnotableLayer(BaseLayer):
             self.messageSignal.emit("No annotation copied to paste.")
 
     def _get_selected_annotation(self):
+        # selected_annotation is kept by the selection paths, reuse it while it
+        # is still selected and sits at its annotation_id, instead of scanning
+        cached = self.selected_annotation
+        if cached is not None and cached.selected:
+            index = cached.annotation_id
+            if 0 <= index < len(self.annotations) and self.annotations[index] is cached:
+                return cached
         for annotation in self.annotations:
             if annotation.selected:
                 return annotation
@@ -1267,9 +1306,6 @@ class AnnotableLayer(BaseLayer):
         # self.loading_dialog.setCancelButton()
         self.loading_dialog.show()
 
-        # Force UI update
-        QApplication.processEvents()
-
         # Setup worker thread
         self.worker_thread = QThread()
         self.worker = LayerifyWorker(self.image, annotations, self.config)
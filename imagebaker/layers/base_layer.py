@@ -663,6 +663,18 @@ class BaseLayer(QWidget):
         self.annotationCleared.emit()
         self.update()
 
+    def release_pixmaps(self):
+        """
+        Drop the layer's pixmaps so their memory is freed right away.
+
+        A layer that is about to be deleted still holds its image until the
+        event loop gets to the deferred delete. Pixmaps shared with other
+        owners, such as a preload cache, stay alive there.
+        """
+        self._image = QPixmap()
+        self._original_image = QPixmap()
+        self._back_buffer = QPixmap()
+
     def paintEvent(self, event):
         self.paint_event()
 
@@ -4,17 +4,22 @@ from datetime import datetime
 import cv2
 from PySide6.QtCore import (
     QLineF,
+    QObject,
     QPoint,
     QPointF,
     QRectF,
+    QRunnable,
+    QSize,
     QSizeF,
     Qt,
     QThread,
+    QThreadPool,
     Signal,
 )
 from PySide6.QtGui import (
     QBrush,
     QColor,
+    QImage,
     QKeyEvent,
     QMouseEvent,
     QPainter,
@@ -38,6 +43,74 @@ from imagebaker.utils.image import draw_annotations, qpixmap_to_numpy
 from imagebaker.workers import BakerWorker
 
 
+class _StateThumbnailSignals(QObject):
+    ready = Signal(int, object, QImage)
+
+
+class _StateThumbnailTask(QRunnable):
+    def __init__(
+        self,
+        step: int,
+        states: list,
+        drawables: list[tuple[QImage, QTransform, float]],
+        bounds: QRectF,
+        factor: float,
+        thumbnail_size: QSize,
+        signals: _StateThumbnailSignals,
+    ):
+        """
+        Paint a saved state into a thumbnail on a pool thread.
+
+        QPainter may draw into a QImage off the GUI thread, so the layers are
+        handed over as QImages and the result comes back as one.
+
+        Args:
+            step (int): The step of the state.
+            states (list): The saved states of the step, handed back so the
+                receiver can tell whether they were replaced meanwhile.
+            drawables (list[tuple[QImage, QTransform, float]]): Image,
+                transform and opacity of each visible layer.
+            bounds (QRectF): Bounding box of all the drawables.
+            factor (float): Scale the layers are painted at.
+            thumbnail_size (QSize): Size the painted state is fitted into.
+            signals (_StateThumbnailSignals): Where to report the thumbnail.
+        """
+        super().__init__()
+        self.step = step
+        self.states = states
+        self.drawables = drawables
+        self.bounds = bounds
+        self.factor = factor
+        self.thumbnail_size = thumbnail_size
+        self.signals = signals
+
+    def run(self):
+        image = QImage(
+            max(1, int(self.bounds.width() * self.factor)),
+            max(1, int(self.bounds.height() * self.factor)),
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.fill(Qt.transparent)
+
+        painter = QPainter(image)
+        try:
+            painter.scale(self.factor, self.factor)
+            painter.translate(-self.bounds.topLeft())
+            for source, transform, opacity in self.drawables:
+                painter.save()
+                painter.setTransform(transform, True)
+                painter.setOpacity(opacity)
+                painter.drawImage(0, 0, source)
+                painter.restore()
+        finally:
+            painter.end()
+
+        thumbnail = image.scaled(
+            self.thumbnail_size, Qt.KeepAspectRatio, Qt.FastTransformation
+        )
+        self.signals.ready.emit(self.step, self.states, thumbnail)
+
+
 class CanvasLayer(BaseLayer):
     layersChanged = Signal()
     layerSelected = Signal(BaseLayer)
@@ -57,7 +130,14 @@ class CanvasLayer(BaseLayer):
         super().__init__(parent, config)
         self.is_annotable = False
         self.last_pan_point = None
-        self.state_thumbnail = dict()
+        # QImage thumbnails per step, converted to QPixmap on the GUI thread
+        self.state_thumbnail: dict[int, QImage] = dict()
+        # step -> the states a thumbnail is being painted for on the pool
+        self._thumbnail_requests: dict[int, list] = {}
+        # layer_id -> (pixmap cacheKey, QImage copy) handed to thumbnail tasks
+        self._thumbnail_sources: dict[str, tuple[int, QImage]] = {}
+        self._thumbnail_signals = _StateThumbnailSignals()
+        self._thumbnail_signals.ready.connect(self._on_state_thumbnail_ready)
 
         self._last_draw_point = None  # Track the last point for smooth drawing
 
@@ -809,6 +889,7 @@ class CanvasLayer(BaseLayer):
         Clear all layers from the canvas layer.
         """
         self.layers.clear()
+        self._thumbnail_sources.clear()
         self._update_back_buffer()
         self.update()
         self.messageSignal.emit("Cleared all layers")
@@ -922,9 +1003,6 @@ class CanvasLayer(BaseLayer):
         self.loading_dialog.setCancelButton(None)  # Remove cancel button if not needed
         self.loading_dialog.show()
 
-        # Force UI update
-        QApplication.processEvents()
-
         # Setup worker thread
         self.worker_thread = QThread()
         self.worker = BakerWorker(
@@ -967,16 +1045,27 @@ class CanvasLayer(BaseLayer):
         """
         self.export_current_state(export_to_annotation_tab=True)
 
-    def seek_state(self, step):
-        """Seek to a specific state using the timeline slider."""
+    def seek_state(self, step, layer_index: dict[str, BaseLayer] | None = None):
+        """
+        Seek to a specific state using the timeline slider.
+
+        Args:
+            step (int): The step to seek to.
+            layer_index (dict[str, BaseLayer], optional): A prebuilt lookup of layers
+                by their id. Layers missing from it are searched in self.layers.
+        """
         self.messageSignal.emit(f"Seeking to step {step}")
-        logger.info(f"Seeking to step {step}")
+        logger.debug(f"Seeking to step {step}")
 
         # Get the states for the selected step
         if step in self.states:
             states = self.states[step]
             for state in states:
-                layer = self.get_layer(state.layer_id)
+                layer = None
+                if layer_index is not None:
+                    layer = layer_index.get(state.layer_id)
+                if layer is None:
+                    layer = self.get_layer(state.layer_id)
                 if layer:
                     # Update the layer's state
                     update_opacities = False
@@ -994,6 +1083,93 @@ class CanvasLayer(BaseLayer):
                         layer._apply_edge_opacity()
                     layer.update()
 
+    def render_state_thumbnail(self, step: int) -> bool:
+        """
+        Start rendering a thumbnail of a saved state on the global thread pool.
+
+        Only the bounds are worked out on the GUI thread. The layers are painted
+        straight at a reduced resolution by a _StateThumbnailTask, the result is
+        stored in state_thumbnail and announced with thumbnailsAvailable.
+
+        Args:
+            step (int): The step of the state to render.
+
+        Returns:
+            bool: Whether a render was started or is already running, False if
+                the step has nothing to draw.
+        """
+        states = self.states.get(step)
+        if not states:
+            return False
+        if self._thumbnail_requests.get(step) is states:
+            return True
+
+        # Bounding box of all the visible layers in this state
+        bounds = QRectF()
+        drawables = []
+        for state in states:
+            layer = self.get_layer(state.layer_id)
+            if layer is None or not state.visible or layer.image.isNull():
+                continue
+            transform = QTransform()
+            transform.translate(state.position.x(), state.position.y())
+            transform.rotate(state.rotation)
+            transform.scale(state.scale_x, state.scale_y)
+            bounds = bounds.united(
+                transform.mapRect(QRectF(QPointF(0, 0), QSizeF(layer.image.size())))
+            )
+            drawables.append(
+                (self._thumbnail_source(layer), transform, state.opacity / 255.0)
+            )
+        if bounds.isEmpty():
+            return False
+
+        factor = min(
+            1.0,
+            self.config.state_thumbnail_source_size
+            / max(bounds.width(), bounds.height()),
+        )
+        self._thumbnail_requests[step] = states
+        QThreadPool.globalInstance().start(
+            _StateThumbnailTask(
+                step,
+                states,
+                drawables,
+                bounds,
+                factor,
+                QSize(*self.config.normal_draw_config.thumbnail_size),
+                self._thumbnail_signals,
+            )
+        )
+        return True
+
+    def _thumbnail_source(self, layer: BaseLayer) -> QImage:
+        """The layer's pixmap as a QImage, converted again only when it changes."""
+        key = layer.image.cacheKey()
+        cached = self._thumbnail_sources.get(layer.layer_id)
+        if cached is None or cached[0] != key:
+            cached = (key, layer.image.toImage())
+            self._thumbnail_sources[layer.layer_id] = cached
+            # forget the images of layers removed from the canvas
+            if len(self._thumbnail_sources) > len(self.layers):
+                layer_ids = {canvas_layer.layer_id for canvas_layer in self.layers}
+                self._thumbnail_sources = {
+                    layer_id: source
+                    for layer_id, source in self._thumbnail_sources.items()
+                    if layer_id in layer_ids
+                }
+        return cached[1]
+
+    def _on_state_thumbnail_ready(self, step: int, states: list, thumbnail: QImage):
+        if self._thumbnail_requests.get(step) is not states:
+            return
+        del self._thumbnail_requests[step]
+        # the states may have been replaced or cleared while painting
+        if self.states.get(step) is not states:
+            return
+        self.state_thumbnail[step] = thumbnail
+        self.thumbnailsAvailable.emit(step)
+
     def play_states(self):
         """Play all the states stored in self.states."""
         if len(self.states) == 0:
@@ -1064,8 +1240,6 @@ class CanvasLayer(BaseLayer):
         self.loading_dialog.setCancelButton(None)
         self.loading_dialog.show()
 
-        QApplication.processEvents()
-
         # Setup worker thread
         self.worker_thread = QThread()
         self.worker = BakerWorker(
@@ -1119,8 +1293,9 @@ class CanvasLayer(BaseLayer):
                             logger.info(f"Saved mask for {mask_name}")
                     logger.info(f"Saved baked image to {filename}")
                     if self.config.write_annotations:
-                        image = qpixmap_to_numpy(image.copy())
-                        image = cv2.cvtColor(image, cv2.COLOR_RGBA2BGRA)
+                        # the conversion already returns an owning copy
+                        image = qpixmap_to_numpy(image)
+                        cv2.cvtColor(image, cv2.COLOR_RGBA2BGRA, dst=image)
                         drawn = draw_annotations(image, annotations)
                         write_to = filename.parent / f"annotated_{filename.name}"
 
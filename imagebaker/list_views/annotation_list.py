@@ -17,6 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from imagebaker import logger
+from imagebaker.core.defs import Annotation
 from imagebaker.layers.annotable_layer import AnnotableLayer
 
 
@@ -58,103 +59,152 @@ class AnnotationList(QDockWidget):
         if self.layer is None:
             return
         for idx, ann in enumerate(self.layer.annotations):
+            self._add_annotation_item(idx, ann, current_selected_ids)
+        scroll_bar.setValue(
+            min(scroll_value, scroll_bar.maximum())
+        )
+        self.update()
 
-            item = QListWidgetItem(self.list_widget)
+    def append_annotations(self, annotations: list[Annotation]):
+        """
+        Add rows for annotations that were just appended to the layer.
 
-            # Create container widget
-            widget = QWidget()
-            widget.setSizePolicy(QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed))
+        Falls back to a full rebuild when the list is not in step with the
+        layer's annotations before the appended ones.
 
-            layout = QHBoxLayout(widget)
-            layout.setContentsMargins(1, 1, 2, 2)
+        Args:
+            annotations (list[Annotation]): The annotations appended last to
+                the layer, in order.
+        """
+        if self.layer is None:
+            return
+        start = len(self.layer.annotations) - len(annotations)
+        if start < 0 or self.list_widget.count() != start:
+            self.update_list()
+            return
+        selected_ids = {ann.annotation_id for ann in annotations if ann.selected}
+        for idx, ann in enumerate(annotations, start=start):
+            self._add_annotation_item(idx, ann, selected_ids)
+        self.update()
 
-            # on clicking this element, select the annotation
-            widget.mousePressEvent = lambda event, i=idx: self.on_annotation_selected(i, event)
+    def update_rows_from(self, first_index: int):
+        """
+        Rebuild only the rows from first_index on.
 
-            widget.setCursor(Qt.PointingHandCursor)
+        Rows capture their position for their click handlers, so after a
+        removal every row past it is rebuilt. Rows before it are untouched.
 
-            # Color indicator
-            color_label = QLabel()
-            color = QColor(ann.color)
-            if not ann.visible:
-                color.setAlpha(128)
-            pixmap = QPixmap(20, 20)
-            pixmap.fill(ann.color)
-            color_label.setPixmap(pixmap)
-            layout.addWidget(color_label)
+        Args:
+            first_index (int): Position of the first annotation that changed.
+        """
+        if self.layer is None or not 0 < first_index <= self.list_widget.count():
+            self.update_list()
+            return
+        for row in range(self.list_widget.count() - 1, first_index - 1, -1):
+            self.list_widget.takeItem(row)
+        tail = self.layer.annotations[first_index:]
+        selected_ids = {ann.annotation_id for ann in tail if ann.selected}
+        for idx, ann in enumerate(tail, start=first_index):
+            self._add_annotation_item(idx, ann, selected_ids)
+        self.update()
 
-            # Text container
-            text_container = QWidget()
-            text_layout = QVBoxLayout(text_container)
-            text_layout.setContentsMargins(0, 0, 0, 0)
+    def _add_annotation_item(
+        self, idx: int, ann: Annotation, current_selected_ids: set[int]
+    ):
+        item = QListWidgetItem(self.list_widget)
 
-            # Main label with conditional color
-            main_label = QLabel(f"{ann.name}")
-            main_color = "#666" if not ann.visible else "black"
+        # Create container widget
+        widget = QWidget()
+        widget.setSizePolicy(QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed))
+
+        layout = QHBoxLayout(widget)
+        layout.setContentsMargins(1, 1, 2, 2)
+
+        # on clicking this element, select the annotation
+        widget.mousePressEvent = lambda event, i=idx: self.on_annotation_selected(
+            i, event
+        )
+
+        widget.setCursor(Qt.PointingHandCursor)
+
+        # Color indicator
+        color_label = QLabel()
+        color = QColor(ann.color)
+        if not ann.visible:
+            color.setAlpha(128)
+        pixmap = QPixmap(20, 20)
+        pixmap.fill(ann.color)
+        color_label.setPixmap(pixmap)
+        layout.addWidget(color_label)
+
+        # Text container
+        text_container = QWidget()
+        text_layout = QVBoxLayout(text_container)
+        text_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Main label with conditional color
+        main_label = QLabel(f"{ann.name}")
+        main_color = "#666" if not ann.visible else "black"
+        main_label.setStyleSheet(f"font-weight: bold; color: {main_color};")
+        text_layout.addWidget(main_label)
+
+        # Change the text color of the selected annotation
+        if ann.selected:
+            main_label.setStyleSheet("font-weight: bold; color: blue;")
+        else:
             main_label.setStyleSheet(f"font-weight: bold; color: {main_color};")
-            text_layout.addWidget(main_label)
 
-            # Change the text color of the selected annotation
-            if ann.selected:
-                main_label.setStyleSheet("font-weight: bold; color: blue;")
-            else:
-                main_label.setStyleSheet(f"font-weight: bold; color: {main_color};")
-
-            # Secondary info
-            secondary_text = []
-            score_text = (
-                f"{ann.annotator}: {ann.score:.2f}"
-                if ann.score is not None
-                else ann.annotator
-            )
-            secondary_text.append(score_text)
-            short_path = ann.file_path.stem[: self.max_name_length]
-            secondary_text.append(f"<span style='color:#666;'>{short_path}</span>")
-
-            if secondary_text:
-                info_color = "#888" if not ann.visible else "#444"
-                info_label = QLabel("<br>".join(secondary_text))
-                info_label.setStyleSheet(f"color: {info_color}; font-size: 10px;")
-                text_layout.addWidget(info_label)
-
-            text_layout.addStretch()
-            layout.addWidget(text_container)
-            layout.addStretch()
-
-            # Buttons
-            btn_container = QWidget()
-            btn_layout = QHBoxLayout(btn_container)
-
-            layerify_btn = QPushButton("🖨")
-            layerify_btn.setFixedWidth(30)
-            layerify_btn.setToolTip("Make AnnotableLayer from annotation")
-            layerify_btn.clicked.connect(lambda _, i=idx: self.layerify_annotation(i))
-            btn_layout.addWidget(layerify_btn)
-
-            vis_btn = QPushButton("👀" if ann.visible else "👁️")
-            vis_btn.setFixedWidth(30)
-            vis_btn.setCheckable(True)
-            vis_btn.setChecked(ann.visible)
-            vis_btn.setToolTip("Visible" if ann.visible else "Hidden")
-            vis_btn.clicked.connect(lambda _, i=idx: self.toggle_visibility(i))
-            btn_layout.addWidget(vis_btn)
-
-            del_btn = QPushButton("🗑️")
-            del_btn.setFixedWidth(30)
-            del_btn.setToolTip("Delete annotation")
-            del_btn.clicked.connect(lambda _, i=idx: self.delete_annotation(i))
-            btn_layout.addWidget(del_btn)
-
-            layout.addWidget(btn_container)
-
-            item.setSizeHint(widget.sizeHint())
-            self.list_widget.setItemWidget(item, widget)
-            if ann.annotation_id in current_selected_ids:
-                item.setSelected(True)
-        scroll_bar.setValue(
-            min(scroll_value, scroll_bar.maximum())
+        # Secondary info
+        secondary_text = []
+        score_text = (
+            f"{ann.annotator}: {ann.score:.2f}"
+            if ann.score is not None
+            else ann.annotator
         )
-        self.update()
+        secondary_text.append(score_text)
+        short_path = ann.file_path.stem[: self.max_name_length]
+        secondary_text.append(f"<span style='color:#666;'>{short_path}</span>")
+
+        if secondary_text:
+            info_color = "#888" if not ann.visible else "#444"
+            info_label = QLabel("<br>".join(secondary_text))
+            info_label.setStyleSheet(f"color: {info_color}; font-size: 10px;")
+            text_layout.addWidget(info_label)
+
+        text_layout.addStretch()
+        layout.addWidget(text_container)
+        layout.addStretch()
+
+        # Buttons
+        btn_container = QWidget()
+        btn_layout = QHBoxLayout(btn_container)
+
+        layerify_btn = QPushButton("🖨")
+        layerify_btn.setFixedWidth(30)
+        layerify_btn.setToolTip("Make AnnotableLayer from annotation")
+        layerify_btn.clicked.connect(lambda _, i=idx: self.layerify_annotation(i))
+        btn_layout.addWidget(layerify_btn)
+
+        vis_btn = QPushButton("👀" if ann.visible else "👁️")
+        vis_btn.setFixedWidth(30)
+        vis_btn.setCheckable(True)
+        vis_btn.setChecked(ann.visible)
+        vis_btn.setToolTip("Visible" if ann.visible else "Hidden")
+        vis_btn.clicked.connect(lambda _, i=idx: self.toggle_visibility(i))
+        btn_layout.addWidget(vis_btn)
+
+        del_btn = QPushButton("🗑️")
+        del_btn.setFixedWidth(30)
+        del_btn.setToolTip("Delete annotation")
+        del_btn.clicked.connect(lambda _, i=idx: self.delete_annotation(i))
+        btn_layout.addWidget(del_btn)
+
+        layout.addWidget(btn_container)
+
+        item.setSizeHint(widget.sizeHint())
+        self.list_widget.setItemWidget(item, widget)
+        if ann.annotation_id in current_selected_ids:
+            item.setSelected(True)
 
     def create_color_icon(self, color):
         pixmap = QPixmap(16, 16)
@@ -186,8 +236,8 @@ class AnnotationList(QDockWidget):
             logger.info(f"Deleting annotation: {self.layer.annotations[index].label}")
             self.layer.annotations[index].selected = True
             self.layer.selected_annotation = self.layer.annotations[index]
+            # the layer's annotationRemoved refreshes the rows from index on
             self.layer.delete_selected_annotations()
-            self.update_list()
             logger.info("Annotation deleted")
 
     def toggle_visibility(self, index):
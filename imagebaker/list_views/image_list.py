@@ -1,7 +1,9 @@
+from collections import OrderedDict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QDockWidget,
     QHBoxLayout,
@@ -16,10 +18,48 @@ from PySide6.QtWidgets import (
 
 from imagebaker import logger
 
+if TYPE_CHECKING:
+    # only for annotations, layerify_tab imports this module at runtime
+    from imagebaker.tabs.layerify_tab import ImageEntry
+
+
+class _ThumbnailSignals(QObject):
+    thumbnailReady = Signal(str, QImage)
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, path: str, size: int, signals: _ThumbnailSignals):
+        """
+        Decode a downscaled thumbnail on a pool thread.
+
+        QImageReader.setScaledSize lets the decoder downscale while reading,
+        which for JPEG skips most of the full-resolution decode.
+
+        Args:
+            path (str): Path of the image file.
+            size (int): Longest side of the thumbnail.
+            signals (_ThumbnailSignals): Where to report the decoded image.
+        """
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        reader = QImageReader(self.path)
+        original_size = reader.size()
+        if original_size.isValid():
+            reader.setScaledSize(
+                original_size.scaled(self.size, self.size, Qt.KeepAspectRatio)
+            )
+        self.signals.thumbnailReady.emit(self.path, reader.read())
+
 
 class ImageListPanel(QDockWidget):
     imageSelected = Signal(object)
     activeImageEntries = Signal(list)
+    thumbnail_size = 50
+    max_cached_thumbnails = 500
 
     def __init__(
         self,
@@ -39,6 +79,14 @@ class ImageListPanel(QDockWidget):
         self.current_page = 0
         self.images_per_page = images_per_page
         self.max_name_length = max_name_length
+
+        # Thumbnails are decoded on the global thread pool and cached by path
+        self._thumbnails: OrderedDict[str, QPixmap] = OrderedDict()
+        self._pending_thumbnails: set[str] = set()
+        # labels on the current page waiting for a thumbnail
+        self._thumbnail_labels: dict[str, list[QLabel]] = {}
+        self._thumbnail_signals = _ThumbnailSignals()
+        self._thumbnail_signals.thumbnailReady.connect(self._on_thumbnail_ready)
         self.init_ui()
 
     def init_ui(self):
@@ -95,73 +143,34 @@ class ImageListPanel(QDockWidget):
             previous_item.data(Qt.UserRole) if previous_item is not None else None
         )
 
+        # rows are rebuilt in one go, repaint once when the page is complete
+        self.list_widget.setUpdatesEnabled(False)
         self.list_widget.clear()
+        self._thumbnail_labels.clear()
 
         # Calculate the range of images to display for the current page
         start_index = self.current_page * self.images_per_page
         end_index = min(start_index + self.images_per_page, len(image_entries))
 
-        # Update the pagination label
-        if len(image_entries) == 0:
-            self.pagination_label.setText("Showing 0 to 0 of 0")
-        else:
-            self.pagination_label.setText(
-                f"Showing {start_index + 1} to {end_index} of {len(image_entries)}"
-            )
+        self._update_pagination_label(start_index, end_index, len(image_entries))
 
         # Display only the images for the current page
         active_image_entries = []
         for idx, image_entry in enumerate(
             image_entries[start_index:end_index], start=start_index + 1
         ):
-            item_widget = QWidget()
-            item_layout = QHBoxLayout(item_widget)
-            item_layout.setContentsMargins(5, 5, 5, 5)
-
-            # Generate thumbnail
-            thumbnail_label = QLabel()
-            if image_entry.is_baked_result:
-                if hasattr(image_entry.data, "get_thumbnail"):
-                    # Legacy baked entry as layer object
-                    thumbnail_pixmap = image_entry.data.get_thumbnail()
-                else:
-                    # Baked entry stored as image path
-                    thumbnail_pixmap = QPixmap(str(image_entry.data)).scaled(
-                        50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                name_label_text = f"Baked Result {idx}"
-            else:
-                thumbnail_pixmap = QPixmap(str(image_entry.data)).scaled(
-                    50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-                name_label_text = Path(image_entry.data).name[: self.max_name_length]
-
-            thumbnail_label.setPixmap(thumbnail_pixmap)
-            item_layout.addWidget(thumbnail_label)
-
-            # Text for image
-            name_label = QLabel(name_label_text)
-            name_label.setStyleSheet("font-weight: bold;")
-            item_layout.addWidget(name_label)
-
-            item_layout.addStretch()
-
-            # Add the custom widget to the list
-            list_item = QListWidgetItem(self.list_widget)
-            list_item.setSizeHint(item_widget.sizeHint())
-            self.list_widget.addItem(list_item)
-            self.list_widget.setItemWidget(list_item, item_widget)
-
-            # Store metadata for the image
-            list_item.setData(Qt.UserRole, image_entry)
+            self._add_image_item(idx, image_entry)
             active_image_entries.append(image_entry)
+        self.list_widget.setUpdatesEnabled(True)
 
         self.activeImageEntries.emit(active_image_entries)
         restored = False
         if previous_entry is not None:
             for row in range(self.list_widget.count()):
                 item = self.list_widget.item(row)
-                if item.data(Qt.UserRole) == previous_entry:
+                # entries compare by identity, match on what they point to so
+                # the selection survives a reload of the same images
+                if item.data(Qt.UserRole).data == previous_entry.data:
                     self.list_widget.setCurrentItem(item)
                     restored = True
                     break
@@ -174,6 +183,123 @@ class ImageListPanel(QDockWidget):
 
         self.update()
 
+    def append_image_entries(self, new_entries: list["ImageEntry"]):
+        """
+        Show entries that were just appended to image_entries.
+
+        When the current page is the last one and has room, only rows for the
+        new entries are added. Otherwise the page holding the last entry is
+        built with update_image_list.
+
+        Args:
+            new_entries (list[ImageEntry]): The entries at the end of
+                image_entries that are not shown yet.
+        """
+        total = len(self.image_entries)
+        first_new = total - len(new_entries)
+        start_index = self.current_page * self.images_per_page
+        last_page = max(total - 1, 0) // self.images_per_page
+        if (
+            self.current_page != last_page
+            or self.list_widget.count() != first_new - start_index
+        ):
+            self.current_page = last_page
+            self.update_image_list(self.image_entries)
+            return
+
+        for idx, image_entry in enumerate(new_entries, start=first_new + 1):
+            self._add_image_item(idx, image_entry)
+        self._update_pagination_label(start_index, total, total)
+        self.activeImageEntries.emit(self.image_entries[start_index:total])
+        if self.list_widget.currentItem() is None and self.list_widget.count() > 0:
+            self.list_widget.setCurrentRow(0)
+
+    def _update_pagination_label(self, start_index: int, end_index: int, total: int):
+        if total == 0:
+            self.pagination_label.setText("Showing 0 to 0 of 0")
+        else:
+            self.pagination_label.setText(
+                f"Showing {start_index + 1} to {end_index} of {total}"
+            )
+
+    def _add_image_item(self, idx: int, image_entry: "ImageEntry"):
+        """Append a row for image_entry, idx being its 1-based global position."""
+        item_widget = QWidget()
+        item_layout = QHBoxLayout(item_widget)
+        item_layout.setContentsMargins(5, 5, 5, 5)
+
+        # Generate thumbnail
+        thumbnail_label = QLabel()
+        thumbnail_label.setFixedSize(self.thumbnail_size, self.thumbnail_size)
+        if image_entry.is_baked_result:
+            if hasattr(image_entry.data, "get_thumbnail"):
+                # Legacy baked entry as layer object
+                thumbnail_label.setPixmap(image_entry.data.get_thumbnail())
+            else:
+                # Baked entry stored as image path
+                self._request_thumbnail(str(image_entry.data), thumbnail_label)
+            name_label_text = f"Baked Result {idx}"
+        else:
+            self._request_thumbnail(str(image_entry.data), thumbnail_label)
+            name_label_text = Path(image_entry.data).name[: self.max_name_length]
+
+        item_layout.addWidget(thumbnail_label)
+
+        # Text for image
+        name_label = QLabel(name_label_text)
+        name_label.setStyleSheet("font-weight: bold;")
+        item_layout.addWidget(name_label)
+
+        item_layout.addStretch()
+
+        # Add the custom widget to the list
+        list_item = QListWidgetItem(self.list_widget)
+        list_item.setSizeHint(item_widget.sizeHint())
+        self.list_widget.addItem(list_item)
+        self.list_widget.setItemWidget(list_item, item_widget)
+
+        # Store metadata for the image
+        list_item.setData(Qt.UserRole, image_entry)
+
+    def _request_thumbnail(self, path: str, label: QLabel):
+        """Show a cached thumbnail, or decode it in the background for label."""
+        pixmap = self._thumbnails.get(path)
+        if pixmap is not None:
+            self._thumbnails.move_to_end(path)
+            label.setPixmap(pixmap)
+            return
+
+        self._thumbnail_labels.setdefault(path, []).append(label)
+        if path not in self._pending_thumbnails:
+            self._pending_thumbnails.add(path)
+            QThreadPool.globalInstance().start(
+                _ThumbnailTask(path, self.thumbnail_size, self._thumbnail_signals)
+            )
+
+    def cache_thumbnail(self, path: str, image: QImage):
+        """
+        Store a thumbnail prepared elsewhere, so the file is not decoded again.
+
+        Args:
+            path (str): Path of the image file.
+            image (QImage): The thumbnail, at most thumbnail_size on each side.
+        """
+        self._on_thumbnail_ready(path, image)
+
+    def _on_thumbnail_ready(self, path: str, image: QImage):
+        self._pending_thumbnails.discard(path)
+        if image.isNull():
+            logger.warning(f"Failed to load thumbnail for {path}")
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        self._thumbnails[path] = pixmap
+        while len(self._thumbnails) > self.max_cached_thumbnails:
+            self._thumbnails.popitem(last=False)
+
+        for label in self._thumbnail_labels.pop(path, []):
+            label.setPixmap(pixmap)
+
     def handle_item_clicked(self, item: QListWidgetItem):
         """Handle item click and emit the imageSelected signal."""
         item_data = item.data(Qt.UserRole)
@@ -1,7 +1,6 @@
-from collections import deque
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QColorDialog,
@@ -19,6 +18,7 @@ from PySide6.QtWidgets import (
 from imagebaker import logger
 from imagebaker.core.configs import CanvasConfig
 from imagebaker.core.defs import Annotation, BakingResult, MouseMode
+from imagebaker.layers.base_layer import BaseLayer
 from imagebaker.layers.canvas_layer import CanvasLayer
 from imagebaker.list_views import LayerList, LayerSettings
 from imagebaker.list_views.canvas_list import CanvasList
@@ -31,6 +31,9 @@ class BakerTab(QWidget):
     bakingResult = Signal(BakingResult)
     requestTabSwitch = Signal(int)
 
+    # Shared gray placeholder for previews whose thumbnail is not available yet
+    _GRAY_PLACEHOLDER: QPixmap | None = None
+
     def __init__(self, main_window, config: CanvasConfig):
         """Initialize the Baker Tab."""
         super().__init__(main_window)
@@ -39,12 +42,34 @@ class BakerTab(QWidget):
         self.toolbar = None
         self.main_layout = QVBoxLayout(self)
 
-        # Deque to store multiple CanvasLayer objects with a fixed size
-        self.canvases = deque(maxlen=self.config.deque_maxlen)
+        # List of CanvasLayer objects, capped at config.deque_maxlen on insertion
+        self.canvases: list[CanvasLayer] = []
 
         # Currently selected canvas
         self.current_canvas = None
 
+        # Reusable state preview widgets, rebound on every regeneration
+        self._preview_pool: list[QPushButton] = []
+        self._preview_by_step: dict[int, QPushButton] = {}
+
+        # Steps whose preview still shows the placeholder. They are rendered
+        # and applied in one batch once their preview is inside the viewport,
+        # the timer only runs after something was queued
+        self._pending_thumbs: set[int] = set()
+        self._thumbs_timer = QTimer(self)
+        self._thumbs_timer.setSingleShot(True)
+        self._thumbs_timer.setInterval(100)
+        self._thumbs_timer.timeout.connect(self._flush_pending_thumbs)
+
+        # Lookup caches for seeking through the states of the current canvas
+        self._layer_index: dict[str, BaseLayer] = {}
+        self._states_sorted_cache: list | None = None
+        self._states_sorted_key: tuple[int, int] | None = None
+        # Number of saved states of the current canvas
+        self._state_count: int = 0
+        # Step last restored by seek_state, None when the layers may differ from it
+        self._seeked_step: int | None = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -92,82 +117,188 @@ class BakerTab(QWidget):
         self.current_canvas.bakingResult.connect(self.bakingResult.emit)
         self.current_canvas.layersChanged.connect(self.update_list)
         self.current_canvas.layerRemoved.connect(self.update_list)
+        self.current_canvas.layersChanged.connect(self._rebuild_layer_index)
+        self.current_canvas.layerRemoved.connect(self._rebuild_layer_index)
+        self.current_canvas.thumbnailsAvailable.connect(self._on_thumbnail_available)
 
         self.canvas_list.canvasSelected.connect(self.on_canvas_selected)
         self.canvas_list.canvasAdded.connect(self.on_canvas_added)
         self.canvas_list.canvasDeleted.connect(self.on_canvas_deleted)
         # self.current_canvas.thumbnailsAvailable.connect(self.generate_state_previews)
+        self._rebuild_layer_index()
 
     def update_slider_range(self, steps):
         """Update the slider range based on the number of steps."""
         self.timeline_slider.setMaximum(steps - 1)
         self.messageSignal.emit(f"Updated steps to {steps}")
         self.timeline_slider.setEnabled(False)  # Disable the slider
-        self.timeline_slider.update()
+
+    def _rebuild_layer_index(self, *_):
+        """Rebuild the layer id lookup of the current canvas."""
+        # The layers changed, so they no longer match the last seeked step
+        self._seeked_step = None
+        if self.current_canvas is None:
+            self._layer_index = {}
+            return
+        self._layer_index = {
+            layer.layer_id: layer for layer in self.current_canvas.layers
+        }
+
+    def _invalidate_states_cache(self):
+        """Drop the cached sorted states of the current canvas."""
+        self._states_sorted_cache = None
+        self._states_sorted_key = None
+        self._seeked_step = None
+
+    def _sync_state_count(self):
+        """Refresh the saved state count after the canvas may have changed it."""
+        self._state_count = (
+            len(self.current_canvas.states) if self.current_canvas is not None else 0
+        )
+
+    def _sorted_states(self) -> list:
+        """Return the states of the current canvas sorted by step."""
+        states = self.current_canvas.states
+        # The canvas may replace or grow its states on its own (e.g. on export)
+        key = (id(states), len(states))
+        if self._states_sorted_cache is None or self._states_sorted_key != key:
+            self._states_sorted_cache = sorted(states.items())
+            self._states_sorted_key = key
+        return self._states_sorted_cache
 
     def generate_state_previews(self):
         """Generate previews for each state."""
-        # Clear existing previews
-        for i in reversed(range(self.preview_layout.count())):
-            widget = self.preview_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
-
-        # Generate a preview for each state
-        for step, states in sorted(self.current_canvas.states.items()):
-            # Create a container widget for the preview
-            preview_widget = QWidget()
-            preview_layout = QVBoxLayout(preview_widget)
-            preview_layout.setContentsMargins(0, 0, 0, 0)
-            preview_layout.setSpacing(2)
+        sorted_states = self._sorted_states()
 
-            # Placeholder thumbnail
-            placeholder = QPixmap(50, 50)
-            placeholder.fill(Qt.gray)  # Gray placeholder
-            thumbnail_label = QLabel()
-            thumbnail_label.setPixmap(placeholder)
-            thumbnail_label.setFixedSize(50, 50)  # Set a fixed size for the thumbnail
-            thumbnail_label.setScaledContents(True)
-
-            # Add the step number on top of the thumbnail
-            step_label = QLabel(f"Step {step}")
-            step_label.setAlignment(Qt.AlignCenter)
-            step_label.setStyleSheet("font-weight: bold; font-size: 10px;")
-
-            # Add a button to make the preview clickable
-            preview_button = QPushButton()
-            preview_button.setFixedSize(
-                50, 70
-            )  # Match the size of the thumbnail + step label
-            preview_button.setStyleSheet("background: transparent; border: none;")
-            preview_button.clicked.connect(lambda _, s=step: self.seek_state(s))
-
-            # Add the thumbnail and step label to the layout
-            preview_layout.addWidget(thumbnail_label)
-            preview_layout.addWidget(step_label)
-
-            # Add the preview widget to the button
-            preview_button.setLayout(preview_layout)
-
-            # Add the button to the preview panel
+        # Grow the pool only when there are more states than pooled previews
+        while len(self._preview_pool) < len(sorted_states):
+            preview_button = self._create_preview_widget()
+            preview_button.hide()
+            self._preview_pool.append(preview_button)
             self.preview_layout.addWidget(preview_button)
 
-            # Update the thumbnail dynamically when it becomes available
-            self.current_canvas.thumbnailsAvailable.connect(
-                lambda step=step, label=thumbnail_label: self.update_thumbnail(
-                    step, label
-                )
-            )
+        # Rebind the pooled previews to the current states
+        self._preview_by_step.clear()
+        for preview_button, (step, _) in zip(
+            self._preview_pool, sorted_states, strict=False
+        ):
+            preview_button.step = step
+            preview_button.step_label.setText(f"Step {step}")
+            preview_button.thumbnail_label.setPixmap(self._gray_placeholder())
+            self._preview_by_step[step] = preview_button
+            preview_button.show()
+
+        # Thumbnails are rendered lazily, only once a preview is inside the
+        # viewport, see _flush_pending_thumbs
+        self._pending_thumbs = set(self._preview_by_step)
+
+        # Hide the previews that are not needed anymore
+        for preview_button in self._preview_pool[len(sorted_states) :]:
+            preview_button.hide()
+
+        self.schedule_thumbnail_flush()
 
         # Refresh the preview panel
         self.preview_panel.update()
 
+    def clear_state_previews(self):
+        """Release all pooled previews and remove them from the preview layout."""
+        while (item := self.preview_layout.takeAt(0)) is not None:
+            widget = item.widget()
+            if widget:
+                widget.setParent(None)
+                widget.deleteLater()
+        self._preview_pool.clear()
+        self._preview_by_step.clear()
+        self._pending_thumbs.clear()
+        self._thumbs_timer.stop()
+
+    @classmethod
+    def _gray_placeholder(cls) -> QPixmap:
+        """Return the shared gray placeholder thumbnail, creating it once."""
+        if cls._GRAY_PLACEHOLDER is None:
+            placeholder = QPixmap(50, 50)
+            placeholder.fill(Qt.gray)
+            cls._GRAY_PLACEHOLDER = placeholder
+        return cls._GRAY_PLACEHOLDER
+
+    def _create_preview_widget(self) -> QPushButton:
+        """Create a reusable preview button with a thumbnail and a step label."""
+        # Create a container layout for the preview
+        preview_layout = QVBoxLayout()
+        preview_layout.setContentsMargins(0, 0, 0, 0)
+        preview_layout.setSpacing(2)
+
+        thumbnail_label = QLabel()
+        thumbnail_label.setFixedSize(50, 50)  # Set a fixed size for the thumbnail
+        thumbnail_label.setScaledContents(True)
+
+        # Add the step number on top of the thumbnail
+        step_label = QLabel()
+        step_label.setAlignment(Qt.AlignCenter)
+        step_label.setStyleSheet("font-weight: bold; font-size: 10px;")
+
+        # Add a button to make the preview clickable
+        preview_button = QPushButton()
+        preview_button.setFixedSize(
+            50, 70
+        )  # Match the size of the thumbnail + step label
+        preview_button.setStyleSheet("background: transparent; border: none;")
+        preview_button.step = 0
+        preview_button.thumbnail_label = thumbnail_label
+        preview_button.step_label = step_label
+        # The step is read at click time so the button can be rebound to other steps
+        preview_button.clicked.connect(
+            lambda _, button=preview_button: self.seek_state(button.step)
+        )
+
+        # Add the thumbnail and step label to the layout
+        preview_layout.addWidget(thumbnail_label)
+        preview_layout.addWidget(step_label)
+        preview_button.setLayout(preview_layout)
+        return preview_button
+
+    def _on_thumbnail_available(self, step):
+        """Queue the preview of a step to be updated on the next flush."""
+        if step in self._preview_by_step:
+            self._pending_thumbs.add(step)
+            self.schedule_thumbnail_flush()
+
+    def schedule_thumbnail_flush(self):
+        """
+        Fill the pending previews that are visible, once events settle.
+
+        Connect the preview scroll area's valueChanged and resize to this, so
+        previews scrolled into view get their thumbnail. Nothing polls, a
+        preview outside the viewport stays pending until the next call.
+        """
+        if self._pending_thumbs:
+            self._thumbs_timer.start()
+
+    def _flush_pending_thumbs(self):
+        """Render and apply the queued thumbnails of the previews in the viewport."""
+        for step in list(self._pending_thumbs):
+            preview_button = self._preview_by_step.get(step)
+            if preview_button is None:
+                self._pending_thumbs.discard(step)
+                continue
+            # Keep scrolled out previews pending until they become visible
+            if preview_button.visibleRegion().isEmpty():
+                continue
+            self._pending_thumbs.discard(step)
+            if step not in self.current_canvas.state_thumbnail:
+                # painted on the thread pool, thumbnailsAvailable queues the step
+                # again once the thumbnail is ready
+                self.current_canvas.render_state_thumbnail(step)
+                continue
+            self.update_thumbnail(step, preview_button.thumbnail_label)
+
     def update_thumbnail(self, step, thumbnail_label):
         """Update the thumbnail for a specific step."""
-        if step in self.current_canvas.state_thumbnail:
-            thumbnail = self.current_canvas.state_thumbnail[step]
-            thumbnail_label.setPixmap(thumbnail)
-            thumbnail_label.update()
+        thumbnail = self.current_canvas.state_thumbnail.get(step)
+        if thumbnail is not None:
+            # Thumbnails are QImages so they can be produced off the GUI thread
+            thumbnail_label.setPixmap(QPixmap.fromImage(thumbnail))
 
     def update_list(self, layer=None):
         """Update the layer list and layer settings."""
@@ -194,6 +325,9 @@ class BakerTab(QWidget):
         self.layer_settings.update_sliders()
         self.canvas_list.update_canvas_list()  # Update the canvas list
         self.layer_list.update_list()
+        self._rebuild_layer_index()
+        self._invalidate_states_cache()
+        self._sync_state_count()
         self.update()
 
     def on_canvas_selected(self, canvas: CanvasLayer):
@@ -211,18 +345,26 @@ class BakerTab(QWidget):
 
         self.layer_list.update_list()
         self.layer_settings.update_sliders()
+        self._rebuild_layer_index()
+        self._invalidate_states_cache()
+        self._sync_state_count()
 
-        logger.info(f"Selected canvas: {canvas.layer_name}")
+        logger.debug(f"Selected canvas: {canvas.layer_name}")
         self.update()
 
     def on_canvas_added(self, new_canvas: CanvasLayer):
         """Handle the addition of a new canvas."""
-        logger.info(f"New canvas added: {new_canvas.layer_name}")
+        logger.debug(f"New canvas added: {new_canvas.layer_name}")
         self.main_layout.addWidget(new_canvas)  # Add the new canvas to the layout
         if self.current_canvas is not None:
             self.current_canvas.setVisible(False)  # Hide the current canvas
 
-        # self.canvases.append(new_canvas)  # Add the new canvas to the deque
+        # The canvas list already appended the new canvas, evict the oldest ones
+        while len(self.canvases) > self.config.deque_maxlen:
+            old_canvas = self.canvases.pop(0)
+            old_canvas.setParent(None)
+            old_canvas.deleteLater()
+
         # connect it to the layer list
         self.layer_list.canvas = new_canvas
         self.current_canvas = new_canvas  # Update the current canvas
@@ -234,12 +376,18 @@ class BakerTab(QWidget):
         self.current_canvas.bakingResult.connect(self.bakingResult.emit)
         self.current_canvas.layersChanged.connect(self.update_list)
         self.current_canvas.layerRemoved.connect(self.update_list)
+        self.current_canvas.layersChanged.connect(self._rebuild_layer_index)
+        self.current_canvas.layerRemoved.connect(self._rebuild_layer_index)
+        self.current_canvas.thumbnailsAvailable.connect(self._on_thumbnail_available)
 
         self.current_canvas.update()
         self.layer_list.layers = new_canvas.layers
         self.layer_list.update_list()
         self.layer_settings.selected_layer = None
         self.layer_settings.update_sliders()
+        self._rebuild_layer_index()
+        self._invalidate_states_cache()
+        self._sync_state_count()
 
     def create_toolbar(self):
         """Create Baker-specific toolbar"""
@@ -261,34 +409,34 @@ class BakerTab(QWidget):
         self.steps_spinbox.valueChanged.connect(self.update_slider_range)
         baker_toolbar_layout.addWidget(self.steps_spinbox)
 
+        # Create the timeline slider, it is placed beside the "Play States" button
+        self.timeline_slider = QSlider(Qt.Horizontal)
+        self.timeline_slider.setMinimum(0)
+        self.timeline_slider.setMaximum(0)  # Will be updated dynamically
+        self.timeline_slider.setValue(0)
+        self.timeline_slider.setSingleStep(1)  # Set the granularity of the slider
+        self.timeline_slider.setPageStep(1)  # Allow smoother jumps
+        self.timeline_slider.setEnabled(False)  # Initially disabled
+        self.timeline_slider.valueChanged.connect(self.seek_state)
+
         # Add buttons for Baker modes with emojis
+        # (text, method name, whether the timeline slider follows the button)
         baker_modes = [
-            ("📤 Export Current State", self.export_current_state),
-            ("💾 Save State", self.save_current_state),
-            ("🔮 Predict State", self.predict_state),
-            ("▶️ Play States", self.play_saved_states),
-            ("🗑️ Clear States", self.clear_states),  # New button
-            ("📤 Annotate States", self.export_for_annotation),
-            ("📤 Export States", self.export_locally),
+            ("📤 Export Current State", "export_current_state", False),
+            ("💾 Save State", "save_current_state", False),
+            ("🔮 Predict State", "predict_state", False),
+            ("▶️ Play States", "play_saved_states", True),
+            ("🗑️ Clear States", "clear_states", False),
+            ("📤 Annotate States", "export_for_annotation", False),
+            ("📤 Export States", "export_locally", False),
         ]
 
-        for text, callback in baker_modes:
+        for text, method_name, needs_slider in baker_modes:
             btn = QPushButton(text)
-            btn.clicked.connect(callback)
+            btn.clicked.connect(getattr(self, method_name))
             baker_toolbar_layout.addWidget(btn)
 
-            # If the button is "Play States", add the slider beside it
-            if text == "▶️ Play States":
-                self.timeline_slider = QSlider(Qt.Horizontal)  # Create the slider
-                self.timeline_slider.setMinimum(0)
-                self.timeline_slider.setMaximum(0)  # Will be updated dynamically
-                self.timeline_slider.setValue(0)
-                self.timeline_slider.setSingleStep(
-                    1
-                )  # Set the granularity of the slider
-                self.timeline_slider.setPageStep(1)  # Allow smoother jumps
-                self.timeline_slider.setEnabled(False)  # Initially disabled
-                self.timeline_slider.valueChanged.connect(self.seek_state)
+            if needs_slider:
                 baker_toolbar_layout.addWidget(self.timeline_slider)
 
         # Add a drawing button
@@ -350,11 +498,13 @@ class BakerTab(QWidget):
         self.messageSignal.emit("Exporting states for prediction...")
         self.requestTabSwitch.emit(0)
         self.current_canvas.export_baked_states(export_to_annotation_tab=True)
+        self._sync_state_count()
 
     def export_locally(self):
         """Export the baked states locally."""
         self.messageSignal.emit("Exporting baked states...")
         self.current_canvas.export_baked_states()
+        self._sync_state_count()
 
     def play_saved_states(self):
         """Play the saved states in sequence."""
@@ -363,18 +513,21 @@ class BakerTab(QWidget):
         # Enable the timeline slider
 
         # Update the slider range based on the number of states
-        if self.current_canvas.states:
-            num_states = len(self.current_canvas.states)
-            self.timeline_slider.setMaximum(num_states - 1)
-            self.steps_spinbox.setValue(
-                num_states
-            )  # Sync the spinbox with the number of states
-            self.timeline_slider.setEnabled(True)
-        else:
-            self.timeline_slider.setMaximum(0)
-            self.steps_spinbox.setValue(1)
-            self.messageSignal.emit("No saved states available.")
-            self.timeline_slider.setEnabled(False)
+        # Signals are blocked so the spinbox does not loop back into
+        # update_slider_range and the slider does not seek while being resized
+        with QSignalBlocker(self.steps_spinbox), QSignalBlocker(self.timeline_slider):
+            if self._state_count:
+                num_states = self._state_count
+                self.timeline_slider.setMaximum(num_states - 1)
+                self.steps_spinbox.setValue(
+                    num_states
+                )  # Sync the spinbox with the number of states
+                self.timeline_slider.setEnabled(True)
+            else:
+                self.timeline_slider.setMaximum(0)
+                self.steps_spinbox.setValue(1)
+                self.messageSignal.emit("No saved states available.")
+                self.timeline_slider.setEnabled(False)
 
         self.timeline_slider.update()
         # Start playing the states
@@ -386,11 +539,15 @@ class BakerTab(QWidget):
         logger.info(f"Saving current state for {self.steps_spinbox.value()}...")
 
         self.current_canvas.save_current_state(steps=self.steps_spinbox.value())
+        self.current_canvas.state_thumbnail.clear()  # Saved steps may be rewritten
+        self._invalidate_states_cache()
+        self._sync_state_count()
         self.messageSignal.emit(
-            f"Current state saved. Total states: {len(self.current_canvas.states)}"
+            f"Current state saved. Total states: {self._state_count}"
         )
 
-        self.steps_spinbox.setValue(1)  # Reset the spinbox value
+        with QSignalBlocker(self.steps_spinbox):
+            self.steps_spinbox.setValue(1)  # Reset the spinbox value
         self.steps_spinbox.update()
         # Disable the timeline slider
         self.timeline_slider.setEnabled(False)
@@ -403,21 +560,29 @@ class BakerTab(QWidget):
             self.current_canvas.previous_state = None
             self.current_canvas.current_step = 0
             self.current_canvas.states.clear()  # Clear all saved states
+            self.current_canvas.state_thumbnail.clear()
+        self._invalidate_states_cache()
+        self._state_count = 0
+        if self._preview_pool:
+            self.clear_state_previews()
         self.timeline_slider.setEnabled(False)  # Disable the slider
-        self.timeline_slider.setMaximum(0)  # Reset the slider range
-        self.timeline_slider.setValue(0)  # Reset the slider position
+        # Resetting the range must not seek into the states that were just cleared
+        with QSignalBlocker(self.timeline_slider):
+            self.timeline_slider.setMaximum(0)  # Reset the slider range
+            self.timeline_slider.setValue(0)  # Reset the slider position
         self.messageSignal.emit("All states cleared.")
-        self.steps_spinbox.setValue(1)  # Reset the spinbox value
-
-        self.steps_spinbox.update()
-        self.timeline_slider.update()
-        self.current_canvas.update()
+        with QSignalBlocker(self.steps_spinbox):
+            self.steps_spinbox.setValue(1)  # Reset the spinbox value
 
     def seek_state(self, step):
         """Seek to a specific state using the timeline slider."""
+        # Nothing to restore for unknown steps or the step that is already shown
+        if step == self._seeked_step or step not in self.current_canvas.states:
+            return
+        self._seeked_step = step
+        # Logging is left to the canvas, this runs on every slider tick
         self.messageSignal.emit(f"Seeking to step {step}")
-        logger.info(f"Seeking to step {step}")
-        self.current_canvas.seek_state(step)
+        self.current_canvas.seek_state(step, layer_index=self._layer_index)
 
         # Update the canvas
         self.current_canvas.update()
@@ -426,16 +591,19 @@ class BakerTab(QWidget):
         """Export the current state as an image."""
         self.messageSignal.emit("Exporting current state...")
         self.current_canvas.export_current_state()
+        self._sync_state_count()
 
     def predict_state(self):
         """Pass the current state to predict."""
         self.messageSignal.emit("Predicting state...")
 
         self.current_canvas.predict_state()
+        self._sync_state_count()
 
     def add_layer(self, layer: CanvasLayer):
         """Add a new layer to the canvas."""
         self.layer_list.add_layer(layer)
+        self._rebuild_layer_index()
         self.layer_settings.selected_layer = self.current_canvas.selected_layer
         self.layer_settings.update_sliders()
 
@@ -450,6 +618,7 @@ class BakerTab(QWidget):
         )
         if handled_by_canvas and self.current_canvas is not None:
             self.current_canvas.handle_key_press(event)
+            self._sync_state_count()
             self.current_canvas.update()
             self.layer_list.update_list()
             self.layer_settings.update_sliders()
@@ -468,6 +637,7 @@ class BakerTab(QWidget):
             balnk_qimage.fill(Qt.transparent)
             new_layer.set_image(balnk_qimage)
             self.current_canvas.layers.append(new_layer)
+            self._rebuild_layer_index()
             self.current_canvas.update()
             self.layer_list.update_list()
             self.messageSignal.emit(f"Added new layer: {new_layer.layer_name}")
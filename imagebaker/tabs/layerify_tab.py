@@ -1,19 +1,36 @@
 import os
 import hashlib
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable
+from functools import partial
 from dataclasses import dataclass
 from pathlib import Path
 
-from PySide6.QtCore import QPointF, QRectF, QSignalBlocker, Qt, QThread, Signal
+import numpy as np
+from PySide6.QtCore import (
+    QPointF,
+    QRectF,
+    QSignalBlocker,
+    Qt,
+    QElapsedTimer,
+    QMetaObject,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import (
     QColor,
     QIcon,
+    QImage,
+    QImageWriter,
     QPixmap,
     QPolygonF,
 )
 from PySide6.QtWidgets import (
     QAbstractItemView,
-    QApplication,
     QColorDialog,
     QComboBox,
     QDialog,
@@ -44,16 +61,180 @@ from imagebaker.core.defs import (
 from imagebaker.layers.annotable_layer import AnnotableLayer
 from imagebaker.list_views import AnnotationList
 from imagebaker.list_views.image_list import ImageListPanel
-from imagebaker.utils.image import qpixmap_to_numpy
-from imagebaker.workers import ModelPredictionWorker
-
-
-@dataclass
+from imagebaker.utils.image import qpointlists_to_csr
+from imagebaker.workers import ModelPredictionWorker, PreloaderWorker
+
+
+_WHITE = QColor(255, 255, 255)
+# label combo icons keyed by QColor.rgba(), they only depend on the colour
+_ICON_CACHE: dict[int, QIcon] = {}
+# a frozenset so the suffix test of each scanned file is a single hash lookup
+_IMG_EXTS = frozenset((".jpg", ".jpeg", ".png", ".bmp", ".tiff"))
+# plain ints for the key codes compared on every key press
+_KEY_0 = int(Qt.Key_0)
+_KEY_9 = int(Qt.Key_9)
+_KEY_DELETE = int(Qt.Key_Delete)
+# zlib level for baked PNGs, most of the size gain of the default level for a
+# fraction of the encode time
+_BAKED_PNG_COMPRESSION = 1
+
+
+def _iter_images(root: Path, recursive: bool = False):
+    """
+    Yield image files under a folder using os.scandir.
+
+    Args:
+        root (Path): Folder to scan.
+        recursive (bool): Whether to descend into subfolders.
+
+    Yields:
+        Path: Path of each image file found.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                    continue
+                name = entry.name
+                # hidden files, e.g. ".png" or macOS "._photo.jpg" resource
+                # forks, are not images even when the suffix says so
+                if name.startswith("."):
+                    continue
+                # lowercase only the suffix rather than the whole file name
+                suffix = name[name.rfind(".") :].lower()
+                if suffix in _IMG_EXTS and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _color_icon(color: QColor) -> QIcon:
+    """
+    Return a 16x16 icon filled with a colour, reusing previously built icons.
+
+    Args:
+        color (QColor): Fill colour of the icon.
+
+    Returns:
+        QIcon: The icon.
+    """
+    key = color.rgba()
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(color)
+        icon = QIcon(pixmap)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+# Entries compare by identity, so list scans never walk into the layer or path
+@dataclass(frozen=True, eq=False)
 class ImageEntry:
     is_baked_result: bool
     data: AnnotableLayer | Path
 
 
+class _BakedResultSignals(QObject):
+    saved = Signal(object, object, QImage, QImage)
+    failed = Signal(object, str)
+
+
+class _SaveBakedResultTask(QRunnable):
+    def __init__(
+        self,
+        image: QImage,
+        filepath: Path,
+        annotations: list[Annotation],
+        annotation_path: Path,
+        thumbnail_size: int,
+        signals: _BakedResultSignals,
+    ):
+        """
+        Write a baked image and its annotations on a pool thread.
+
+        Encoding a large PNG or JPEG takes long enough to stall the GUI when a
+        batch of results arrives. QImage.save is reentrant, so it can run off
+        the GUI thread. The annotation copies and the image list thumbnail are
+        prepared here as well, leaving only the bookkeeping to the GUI thread.
+
+        Args:
+            image (QImage): The baked image.
+            filepath (Path): Where to write the image.
+            annotations (list[Annotation]): The baked annotations, copied
+                before they are handed back.
+            annotation_path (Path): Where to write the annotations.
+            thumbnail_size (int): Longest side of the image list thumbnail.
+            signals (_BakedResultSignals): Where to report the outcome.
+        """
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        self.annotations = annotations
+        self.annotation_path = annotation_path
+        self.thumbnail_size = thumbnail_size
+        self.signals = signals
+
+    def run(self):
+        try:
+            annotations = [ann.copy() for ann in self.annotations]
+            self._write_image()
+            Annotation.save_as_json(annotations, self.annotation_path)
+            thumbnail = self.image.scaled(
+                self.thumbnail_size,
+                self.thumbnail_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+        except Exception as e:
+            logger.exception(f"Failed to save baked result: {e}")
+            self.signals.failed.emit(self.filepath, str(e))
+            return
+        self.signals.saved.emit(self.filepath, annotations, self.image, thumbnail)
+
+    def _write_image(self):
+        # the writer closes the file when it goes away at the end of this call
+        writer = QImageWriter(str(self.filepath))
+        if self.filepath.suffix.lower() == ".png":
+            writer.setCompression(_BAKED_PNG_COMPRESSION)
+        if not writer.write(self.image):
+            raise OSError(f"Could not write {self.filepath}: {writer.errorString()}")
+
+
+class _SaveAnnotationsTask(QRunnable):
+    def __init__(
+        self,
+        annotations: list[Annotation],
+        annotation_path: Path,
+        delete_if_empty: bool,
+    ):
+        """
+        Write a layer's annotations to its cache file on a pool thread.
+
+        Args:
+            annotations (list[Annotation]): Copies of the layer's annotations,
+                the layer keeps being edited while the file is written.
+            annotation_path (Path): Where to write the annotations.
+            delete_if_empty (bool): Remove the file when there is nothing to save.
+        """
+        super().__init__()
+        self.annotations = annotations
+        self.annotation_path = annotation_path
+        self.delete_if_empty = delete_if_empty
+
+    def run(self):
+        try:
+            if len(self.annotations) > 0:
+                Annotation.save_as_json(self.annotations, self.annotation_path)
+                logger.info(f"Saved annotations to {self.annotation_path}")
+            elif self.delete_if_empty and self.annotation_path.exists():
+                os.remove(self.annotation_path)
+                logger.info(f"Removed empty annotation file: {self.annotation_path}")
+        except Exception as e:
+            logger.exception(f"Failed to save annotations: {e}")
+
+
 class LayerifyTab(QWidget):
     """Layerify Tab implementation"""
 
@@ -64,6 +245,13 @@ class LayerifyTab(QWidget):
     annotationAdded = Signal(Annotation)
     annotationUpdated = Signal(Annotation)
     gotToTab = Signal(int)
+    preloadRequested = Signal(list)
+    predictionRequested = Signal(object, object, object, object, object, object)
+
+    # flush pending baked results without waiting for the timer past this many
+    baked_batch_max = 16
+    # quiet period after an edit before the layer's annotations are written
+    save_delay_ms = 500
 
     def __init__(
         self,
@@ -92,7 +280,17 @@ class LayerifyTab(QWidget):
         self.all_models = loaded_models
         self.current_model = list(self.all_models.values())[0]
         self.current_label = self.config.default_label.name
+        # names of config.predefined_labels, for constant time membership tests
+        # and digit key lookups, rebuilt by _refresh_label_names
+        self._label_names: set[str] = set()
+        # Qt.Key_0..Key_9 -> (label index, label name) for the digit shortcuts
+        self._label_by_key: dict[int, tuple[int, str]] = {}
+        self._refresh_label_names()
         self.image_entries = []
+        # id(entry) -> position in image_entries, kept in step with the list
+        self._entry_index: dict[int, int] = {}
+        # (image path, cache dir) -> annotation cache file, see _cache_path_for_file
+        self._cache_paths: dict[tuple[Path, Path], Path] = {}
         self.curr_image_idx = 0
         self.processed_images = set()
         self.mode_buttons = {}
@@ -102,28 +300,246 @@ class LayerifyTab(QWidget):
         self.baked_results: deque[AnnotableLayer] = deque(
             maxlen=self.config.deque_maxlen
         )
+        # connections made in _connect_layer_signals, undone in _drop_layer
+        self._layer_connections: dict[
+            AnnotableLayer, list[QMetaObject.Connection]
+        ] = {}
         self.layer = None
+        # the one layer currently shown, so switching only touches two layers
+        self._visible_layer: AnnotableLayer | None = None
+        # first annotation list row to rebuild, None when no refresh is pending
+        self._list_update_from: int | None = None
+        # status messages are throttled, see _emit_msg
+        self._msg_timer = QElapsedTimer()
+        self._msg_timer.start()
+        self._pending_msg: str | None = None
+        self._msg_flush_scheduled = False
+        # key being held down, so autorepeat ticks of it can be skipped
+        self._last_key: int | None = None
+        # unmodified shortcut keys, digits are looked up in _label_by_key first
+        self._key_handlers: dict[int, Callable[[], None]] = {
+            _KEY_DELETE: self._delete_selected,
+            int(Qt.Key_Q): partial(self._set_mode_from_key, MouseMode.POINT),
+            int(Qt.Key_W): partial(self._set_mode_from_key, MouseMode.POLYGON),
+            int(Qt.Key_E): partial(self._set_mode_from_key, MouseMode.RECTANGLE),
+            int(Qt.Key_H): self._toggle_annotation_visibility,
+            int(Qt.Key_L): self._layerify_selected,
+            int(Qt.Key_C): self._edit_selected_caption,
+        }
+        # baked results arrive in bursts, the image list is refreshed per batch
+        self._pending_baked: list[ImageEntry] = []
+        self._baked_timer = QTimer(self)
+        self._baked_timer.setSingleShot(True)
+        self._baked_timer.setInterval(75)
+        self._baked_timer.timeout.connect(self._flush_baked_results)
+        self._baked_signals = _BakedResultSignals()
+        self._baked_signals.saved.connect(self._on_baked_result_saved)
+        self._baked_signals.failed.connect(self._on_baked_result_failed)
+        # edits mark their layer dirty, the annotations are written once the
+        # edits settle. One thread keeps writes to the same file in order.
+        self._pending_saves: set[AnnotableLayer] = set()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.save_delay_ms)
+        self._save_timer.timeout.connect(self._flush_pending_saves)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._init_preloader()
+        self._init_predictor()
         self.init_ui()
         self._connect_signals()
 
-    def _connect_signals(self):
-        """Connect all necessary signals"""
-        # Connect all layers in the deque to annotation list
+    def _init_preloader(self):
+        """Start the background thread that decodes neighbouring images."""
+        self._preload_cache: OrderedDict[Path, QPixmap] = OrderedDict()
+        self._preload_in_flight: set[Path] = set()
+        # layers waiting on an in-flight decode instead of decoding it again
+        self._awaiting_preload: dict[Path, AnnotableLayer] = {}
+
+        self._preload_thread = QThread(self)
+        self._preload_worker = PreloaderWorker()
+        self._preload_worker.moveToThread(self._preload_thread)
+        self.preloadRequested.connect(self._preload_worker.request_preload)
+        self._preload_worker.preloaded.connect(self._on_image_preloaded)
+        self._preload_worker.error.connect(self._on_preload_error)
+        self._preload_thread.finished.connect(self._preload_worker.deleteLater)
+        self._preload_thread.start()
+
+    def _init_predictor(self):
+        """Start the long-lived thread that runs model predictions."""
+        self._predict_thread = QThread(self)
+        self._predict_worker = ModelPredictionWorker()
+        self._predict_worker.moveToThread(self._predict_thread)
+        self.predictionRequested.connect(self._predict_worker.submit)
+        self._predict_worker.finished.connect(self.handle_model_result)
+        self._predict_worker.error.connect(self.handle_model_error)
+        self._predict_thread.finished.connect(self._predict_worker.deleteLater)
+        self._predict_thread.start()
+
+    def shutdown_workers(self):
+        """Stop the preloader and prediction threads and finish pending saves."""
+        self._wait_for_saves()
+        for thread in (self._preload_thread, self._predict_thread):
+            thread.quit()
+            thread.wait()
+
+    def _preload_neighbors(self):
+        """Ask the preloader to decode the images before and after the current one."""
+        num_entries = len(self.image_entries)
+        if num_entries < 2 or self.curr_image_idx < 0:
+            return
+        paths = []
+        for offset in (1, -1):
+            entry = self.image_entries[(self.curr_image_idx + offset) % num_entries]
+            path = self._entry_file_path(entry)
+            if path in self._preload_cache or path in self._preload_in_flight:
+                continue
+            self._preload_in_flight.add(path)
+            paths.append(path)
+        if paths:
+            self.preloadRequested.emit(paths)
+
+    def _on_image_preloaded(self, path: Path, image: QImage):
+        self._preload_in_flight.discard(path)
+        pixmap = QPixmap.fromImage(image)
+        self._cache_pixmap(path, pixmap)
+
+        layer = self._awaiting_preload.pop(path, None)
+        if layer is not None and layer.file_path == path:
+            layer.set_image(QPixmap(pixmap))
+
+    def _cache_pixmap(self, path: Path, pixmap: QPixmap):
+        """Keep a decoded image in the bounded preload cache."""
+        self._preload_cache[path] = pixmap
+        self._preload_cache.move_to_end(path)
+        while len(self._preload_cache) > self.config.preload_cache_size:
+            self._preload_cache.popitem(last=False)
+
+    def _on_preload_error(self, path: Path, error_msg: str):
+        self._preload_in_flight.discard(path)
+        layer = self._awaiting_preload.pop(path, None)
+        if layer is not None and layer.file_path == path:
+            layer.set_image(path)
+
+    def _loaded_pixmap(self, path: Path, exclude: AnnotableLayer) -> QPixmap | None:
+        """Return the decoded image of another page layer already showing path."""
         for layer in self.annotable_layers:
-            # layer.annotationAdded.connect(self.annotation_list.update_list)
-            layer.annotationAdded.connect(self.on_annotation_added)
-            # layer.annotationUpdated.connect(self.annotation_list.update_list)
-            layer.annotationUpdated.connect(self.on_annotation_updated)
-            layer.annotationRemoved.connect(self.on_annotation_removed)
-            layer.modeChanged.connect(lambda _mode, self=self: self.sync_mode_buttons())
-            layer.messageSignal.connect(self.messageSignal)
-            layer.layerSignal.connect(self.add_layer)
-            layer.labelUpdated.connect(self.on_label_update)
+            if (
+                layer is not exclude
+                and layer.file_path == path
+                and not layer.image.isNull()
+            ):
+                return layer.image
+        return None
+
+    def _set_layer_image(self, layer: AnnotableLayer, path: Path):
+        """
+        Set a layer's image, reusing an already decoded pixmap when one is available.
+
+        The preload cache is checked first, then the other layers of the page.
+        Pixmaps are handed over as shallow copies. set_image(Path) reloads the
+        layer's QPixmap in place, which would otherwise overwrite the source.
+
+        Layers act as a pool: a layer already showing path is left as is, and
+        the image a layer gives up goes to the preload cache, so going back
+        to it does not decode it again.
+        """
+        if layer.file_path == path and not layer.image.isNull():
+            return
+        # a pending save belongs to the image the layer is giving up
+        if layer in self._pending_saves:
+            self._flush_pending_saves()
+        # while a decode is awaited the old image is still shown under the
+        # new file_path, it must not be cached under that path
+        awaiting = self._awaiting_preload.get(layer.file_path) is layer
+        if not layer.image.isNull() and not awaiting:
+            self._cache_pixmap(layer.file_path, QPixmap(layer.image))
+
+        pixmap = self._preload_cache.get(path)
+        if pixmap is not None:
+            self._preload_cache.move_to_end(path)
+        else:
+            pixmap = self._loaded_pixmap(path, exclude=layer)
+
+        if pixmap is not None:
+            layer.set_image(QPixmap(pixmap))
+        elif path in self._preload_in_flight:
+            # the decode is already running, hand its result over when it lands
+            self._awaiting_preload[path] = layer
+        else:
+            layer.set_image(path)
+        layer.file_path = path
 
+    def _connect_signals(self):
+        """Connect all necessary signals"""
+        # Layers are connected as they are created, see _acquire_layer
         # Connect image list panel signals
         self.image_list_panel.imageSelected.connect(self.on_image_selected)
         self.image_list_panel.activeImageEntries.connect(self.update_active_entries)
 
+    def _connect_layer_signals(self, layer: AnnotableLayer):
+        """
+        Connect a layer to the annotation list and the tab's slots.
+
+        A layer is connected once, connecting it again would make every
+        signal reach its slot twice.
+        """
+        if layer in self._layer_connections:
+            return
+        self._layer_connections[layer] = [
+            # layer.annotationAdded.connect(self.annotation_list.update_list)
+            layer.annotationAdded.connect(self.on_annotation_added),
+            # layer.annotationUpdated.connect(self.annotation_list.update_list)
+            layer.annotationUpdated.connect(self.on_annotation_updated),
+            layer.annotationRemoved.connect(self.on_annotation_removed),
+            layer.modeChanged.connect(self._on_layer_mode_changed),
+            layer.messageSignal.connect(self._emit_msg),
+            layer.layerSignal.connect(self.add_layer),
+            layer.labelUpdated.connect(self.on_label_update),
+        ]
+
+    def _drop_layer(self, layer: AnnotableLayer):
+        """Disconnect a layer that is leaving the pool and schedule its deletion."""
+        if layer in self._pending_saves:
+            self._flush_pending_saves()
+        for connection in self._layer_connections.pop(layer, []):
+            QObject.disconnect(connection)
+        if layer is self._visible_layer:
+            self._visible_layer = None
+        self.main_layout.removeWidget(layer)
+        layer.hide()
+        layer.release_pixmaps()
+        layer.deleteLater()
+
+    def _acquire_layer(self, slot: int) -> AnnotableLayer:
+        """
+        Return the layer for a page slot, creating it the first time it is needed.
+
+        Args:
+            slot (int): Position of the layer on the current page. Slots are
+                filled in order, so this is at most len(annotable_layers).
+
+        Returns:
+            AnnotableLayer: The layer for the slot.
+        """
+        if slot < len(self.annotable_layers):
+            return self.annotable_layers[slot]
+
+        layer = AnnotableLayer(
+            parent=self.main_window,
+            config=self.config,
+            canvas_config=self.canvas_config,
+        )
+        layer.setVisible(False)  # Layers start hidden
+        self._connect_layer_signals(layer)
+        # deque.append would silently drop the oldest layer with its
+        # connections still live, so evict it explicitly
+        if len(self.annotable_layers) == self.annotable_layers.maxlen:
+            self._drop_layer(self.annotable_layers.popleft())
+        self.annotable_layers.append(layer)
+        self.main_layout.addWidget(layer)
+        return layer
+
     def init_ui(self):
         """Initialize the UI components"""
         # Create annotation list and image list panel
@@ -138,22 +554,11 @@ class LayerifyTab(QWidget):
 
         self.main_window.addDockWidget(Qt.LeftDockWidgetArea, self.image_list_panel)
 
-        # Add multiple layers (canvas) to the main layout
-        for _ in range(self.annotable_layers.maxlen):
-            layer = AnnotableLayer(
-                parent=self.main_window,
-                config=self.config,
-                canvas_config=self.canvas_config,
-            )
-            layer.setVisible(False)  # Initially hide all layers
-            self.annotable_layers.append(layer)
-            self.main_layout.addWidget(layer)
-
+        # Only the first layer is created up front, the rest on demand
         # Set the annotation list to the first layer by default
-        if self.annotable_layers:
-            self.layer = self.annotable_layers[0]
-            self.layer.set_mode(MouseMode.RECTANGLE)
-            self.annotation_list.layer = self.layer
+        self.layer = self._acquire_layer(0)
+        self.layer.set_mode(MouseMode.RECTANGLE)
+        self.annotation_list.layer = self.layer
 
         self.create_toolbar()
 
@@ -175,15 +580,25 @@ class LayerifyTab(QWidget):
         if not label_name:
             return False
 
-        existing_names = [label.name for label in self.config.predefined_labels]
-        if label_name in existing_names:
+        if label_name in self._label_names:
             return False
 
         self.config.predefined_labels.append(
             Label(name=label_name, color=color or QColor(255, 255, 255))
         )
+        self._label_names.add(label_name)
+        label_index = len(self.config.predefined_labels) - 1
+        if label_index <= 9:
+            self._label_by_key[_KEY_0 + label_index] = (label_index, label_name)
         return True
 
+    def _refresh_label_names(self):
+        labels = self.config.predefined_labels
+        self._label_names = {label.name for label in labels}
+        self._label_by_key = {
+            _KEY_0 + i: (i, label.name) for i, label in enumerate(labels[:10])
+        }
+
     def sync_labels_from_annotations(self, annotations: list[Annotation]):
         added_any = False
         for annotation in annotations:
@@ -200,34 +615,45 @@ class LayerifyTab(QWidget):
             return Path(image_entry.data.file_path)
         return Path(image_entry.data)
 
+    def _rebuild_entry_index(self):
+        self._entry_index = {
+            id(entry): idx for idx, entry in enumerate(self.image_entries)
+        }
+
+    def _show_layer(self, layer: AnnotableLayer | None):
+        """
+        Make layer the only visible layer, or hide the visible one if None.
+
+        Args:
+            layer (AnnotableLayer | None): The layer to show.
+        """
+        if self._visible_layer is not None and self._visible_layer is not layer:
+            self._visible_layer.setVisible(False)
+        if layer is not None:
+            layer.setVisible(True)
+        self._visible_layer = layer
+
     def on_image_selected(self, image_entry: ImageEntry):
         """Handle image selection from the image list panel."""
         logger.info(f"Image selected: {image_entry}")
 
-        # Hide all layers first
-        for idx, layer in enumerate(self.annotable_layers):
-            layer.setVisible(False)
-            # logger.info(f"Layer {idx} hidden.")
         current_label = self.layer.current_label
         current_color = self.layer.current_color
 
         # Render selected entry into a deterministic visible slot to avoid
         # page-index/modulo remapping bugs.
-        selected_layer = self.annotable_layers[0]
+        selected_layer = self._acquire_layer(0)
         # Resolve by object identity to avoid wrong matches when equal-value
         # entries (same path) exist in the list.
-        self.curr_image_idx = next(
-            (idx for idx, entry in enumerate(self.image_entries) if entry is image_entry),
-            -1,
-        )
+        self.curr_image_idx = self._entry_index.get(id(image_entry), -1)
         if self.curr_image_idx < 0:
             logger.warning("Selected image entry not found in image_entries.")
+            self._show_layer(None)
             return
-        selected_layer.setVisible(True)
+        self._show_layer(selected_layer)
 
         selected_path = self._entry_file_path(image_entry)
-        selected_layer.set_image(selected_path)
-        selected_layer.file_path = selected_path
+        self._set_layer_image(selected_layer, selected_path)
 
         self.load_layer_annotations(selected_layer)
         if self.layer:
@@ -239,14 +665,15 @@ class LayerifyTab(QWidget):
         self.layer.current_color = current_color
         self.sync_labels_from_annotations(self.layer.annotations)
         self.annotation_list.layer = self.layer
-        self.annotation_list.update_list()
+        self._schedule_list_update()
         self.update_label_combo()
         self.sync_mode_buttons()
         self.sync_label_combo_to_selection()
 
-        self.messageSignal.emit(
+        self._emit_msg(
             f"Showing image {self.curr_image_idx + 1}/{len(self.image_entries)}"
         )
+        self._preload_neighbors()
         self.update()
 
     def load_default_images(self):
@@ -259,25 +686,28 @@ class LayerifyTab(QWidget):
 
         # Load images into layers if any are found
         if self.image_entries:
-            for i, layer in enumerate(self.annotable_layers):
+            for i in range(self.annotable_layers.maxlen):
                 if i < len(self.image_entries):
-                    layer.set_image(self._entry_file_path(self.image_entries[i]))
+                    layer = self._acquire_layer(i)
+                    self._set_layer_image(
+                        layer, self._entry_file_path(self.image_entries[i])
+                    )
                     self.load_layer_annotations(layer)
                     self.sync_labels_from_annotations(layer.annotations)
                     layer.layer_name = f"Layer_{i + 1}"
-                    layer.setVisible(
-                        i == 0
-                    )  # Only the first layer is visible by default
+                    # Only the first layer is visible by default
                     if i == 0:
+                        self._show_layer(layer)
                         self.layer = layer  # Set the first layer as the current layer
                         # Select the first item in the image list panel's list widget
                         if self.image_list_panel.list_widget.count() > 0:
                             self.image_list_panel.list_widget.setCurrentRow(0)
 
-                else:
-                    layer.setVisible(False)
+                elif i < len(self.annotable_layers):
+                    self.annotable_layers[i].setVisible(False)
 
             self.messageSignal.emit(f"Showing image 1/{len(self.image_entries)}")
+            self._preload_neighbors()
         else:
             # If no images are found, log a message
             logger.warning("No images found in the assets folder.")
@@ -285,7 +715,6 @@ class LayerifyTab(QWidget):
 
         # Update the image list panel
         self.image_list_panel.update_image_list(self.image_entries)
-        self.update()
 
     def save_layer_annotations(
         self,
@@ -294,6 +723,10 @@ class LayerifyTab(QWidget):
         delete_if_empty: bool = True,
     ):
         """Save annotations for a specific layer"""
+        # this write supersedes any queued one, and must land after those
+        # already running
+        self._pending_saves.discard(layer)
+        self._save_pool.waitForDone()
         file_path = layer.file_path
         if save_dir is None:
             # Save to the cache directory
@@ -309,16 +742,54 @@ class LayerifyTab(QWidget):
             os.remove(save_dir)
             logger.info(f"Removed empty annotation file: {save_dir}")
 
+    def _queue_layer_save(self, layer: AnnotableLayer):
+        """Mark a layer's annotations for saving once the current edits settle."""
+        if layer is None:
+            return
+        self._pending_saves.add(layer)
+        self._save_timer.start()
+
+    def _flush_pending_saves(self):
+        """Write the annotations of every dirty layer on the save pool."""
+        self._save_timer.stop()
+        pending, self._pending_saves = self._pending_saves, set()
+        for layer in pending:
+            if not layer.file_path:
+                continue
+            self._save_pool.start(
+                _SaveAnnotationsTask(
+                    [ann.copy() for ann in layer.annotations],
+                    self._cache_path_for_file(layer.file_path),
+                    delete_if_empty=True,
+                )
+            )
+
+    def _wait_for_saves(self):
+        """Write pending annotations and block until the cache files are current."""
+        self._flush_pending_saves()
+        self._save_pool.waitForDone()
+
     def _cache_path_for_file(self, file_path: Path, base_dir: Path | None = None) -> Path:
-        """Create a stable cache path for an image path using full-path identity."""
+        """
+        Create a stable cache path for an image path using full-path identity.
+
+        Every save and load asks for the path, so it is computed once per
+        image and cache directory.
+        """
         if base_dir is None:
             base_dir = self.config.cache_dir
-        normalized = str(Path(file_path))
-        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
-        safe_name = Path(file_path).name
-        return base_dir / f"{safe_name}.{digest}.json"
+        key = (file_path, base_dir)
+        cache_path = self._cache_paths.get(key)
+        if cache_path is None:
+            normalized = str(Path(file_path))
+            digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+            safe_name = Path(file_path).name
+            cache_path = base_dir / f"{safe_name}.{digest}.json"
+            self._cache_paths[key] = cache_path
+        return cache_path
 
     def get_all_annotations(self) -> list[Annotation]:
+        self._wait_for_saves()
         for layer in self.annotable_layers:
             self.save_layer_annotations(layer)
 
@@ -339,6 +810,10 @@ class LayerifyTab(QWidget):
         return merged_annotations
 
     def load_merged_annotations(self, annotations: list[Annotation]):
+        # the merged annotations replace whatever the layers still had queued
+        self._save_timer.stop()
+        self._pending_saves.clear()
+        self._save_pool.waitForDone()
         annotations_by_file = defaultdict(list)
         for annotation in annotations:
             annotations_by_file[Path(annotation.file_path)].append(annotation)
@@ -369,6 +844,7 @@ class LayerifyTab(QWidget):
         self, layer: AnnotableLayer, load_dir: Path | None = None
     ):
         """Load annotations for a specific layer"""
+        self._wait_for_saves()
         if layer.file_path:
             file_path = layer.file_path
             if load_dir is None:
@@ -387,37 +863,47 @@ class LayerifyTab(QWidget):
                 logger.warning(f"No annotations found for {layer.layer_name}")
 
     def update_active_entries(self, image_entries: list[ImageEntry]):
-        """Update the active entries in the image list panel."""
-        # Persist only the actively edited layer before remapping page slots.
-        if self.layer is not None:
-            self.save_layer_annotations(self.layer, delete_if_empty=False)
+        """
+        Update the active entries in the image list panel.
+
+        A slot that already shows its entry keeps its image and annotations.
+        Its annotations are current in memory, since edits are saved from
+        them, so repeated emits for the same page neither decode nor read
+        anything. A layer that moves to another image keeps its annotations
+        until _set_layer_image has written its pending edits, only then are
+        they replaced by those of the new image.
+        """
         self.curr_image_idx = 0
         page_start = self.image_list_panel.current_page * self.image_list_panel.images_per_page
-        for i, layer in enumerate(self.annotable_layers):
-            layer.annotations = []
-
-            if i < len(image_entries):
-                # Use deterministic global index for the current page instead of
-                # value-based lookup, which can point to a wrong duplicate entry.
-                idx = page_start + i
-                if idx >= len(self.image_entries):
-                    layer.setVisible(False)
-                    continue
-                entry = self.image_entries[idx]
-                entry_path = self._entry_file_path(entry)
-                layer.set_image(entry_path)
-                layer.file_path = entry_path
+        for i in range(self.annotable_layers.maxlen):
+            # Use deterministic global index for the current page instead of
+            # value-based lookup, which can point to a wrong duplicate entry.
+            idx = page_start + i
+            if i >= len(image_entries) or idx >= len(self.image_entries):
+                # Slots past the page are left alone if they were never created.
+                # A hidden slot keeps the annotations of the image it still
+                # holds, so they stay valid when the slot is shown again.
+                if i < len(self.annotable_layers):
+                    self.annotable_layers[i].setVisible(False)
+                continue
+
+            layer = self._acquire_layer(i)
+            entry = self.image_entries[idx]
+            entry_path = self._entry_file_path(entry)
+            if layer.file_path != entry_path or layer.image.isNull():
+                # flushes a pending save with the annotations of the old image,
+                # they must not be cleared before, see _flush_pending_saves
+                self._set_layer_image(layer, entry_path)
+                layer.annotations = []
                 self.load_layer_annotations(layer)
 
-                layer.layer_name = f"Layer_{idx + 1}"
-                layer.setVisible(i == 0)
-                if i == 0:
-                    self.layer = layer
-                    # update annotation list to the first layer
-                    self.annotation_list.layer = self.layer
-                    self.annotation_list.update_list()
-            else:
-                layer.setVisible(False)
+            layer.layer_name = f"Layer_{idx + 1}"
+            if i == 0:
+                self._show_layer(layer)
+                self.layer = layer
+                # update annotation list to the first layer
+                self.annotation_list.layer = self.layer
+                self._schedule_list_update()
         logger.info("Updated active entries in image list panel.")
 
     def clear_annotations(self):
@@ -426,13 +912,18 @@ class LayerifyTab(QWidget):
             # Clear layer annotations
             self.clearAnnotations.emit()
             self.messageSignal.emit("Annotations cleared")
+            # a queued save would bring the cleared annotations back
+            self._pending_saves.discard(self.layer)
+            self._save_pool.waitForDone()
             # clear cache annotation of layer
             annotation_path = (
                 self._cache_path_for_file(self.layer.file_path)
             )
-            if annotation_path.exists():
-                os.remove(annotation_path)
+            try:
+                annotation_path.unlink()
                 logger.info(f"Cleared annotations from {annotation_path}")
+            except FileNotFoundError:
+                pass
 
         except Exception as e:
             logger.error(f"Clear error: {str(e)}")
@@ -456,10 +947,10 @@ class LayerifyTab(QWidget):
             logger.info(f"Label {annotation.label} created.")
             self.update_label_combo()
         logger.info(f"Added annotation: {annotation.label}")
-        self.messageSignal.emit(f"Added annotation: {annotation.label}")
-        self.save_layer_annotations(self.layer)
+        self._emit_msg(f"Added annotation: {annotation.label}")
+        self._queue_layer_save(self.layer)
         # Refresh the annotation list
-        self.annotation_list.update_list()
+        self._schedule_list_update()
 
     def on_annotation_updated(self, annotation: Annotation):
         """
@@ -469,31 +960,92 @@ class LayerifyTab(QWidget):
             annotation (Annotation): The updated annotation.
         """
         # logger.info(f"Updated annotation: {annotation}")
-        self.messageSignal.emit(f"Updated annotation: {annotation.label}")
+        self._emit_msg(f"Updated annotation: {annotation.label}")
 
         # Refresh the annotation list
-        self.annotation_list.update_list()
+        self._schedule_list_update()
         self.sync_label_combo_to_selection()
-        self.save_layer_annotations(self.layer)
+        self._queue_layer_save(self.layer)
 
-    def on_annotation_removed(self):
+    def on_annotation_removed(self, first_index: int = 0):
         """Handle annotation removed event and persist the current layer state."""
-        self.messageSignal.emit("Annotation removed")
-        self.save_layer_annotations(self.layer)
-        self.annotation_list.update_list()
+        self._emit_msg("Annotation removed")
+        self._queue_layer_save(self.layer)
+        self._schedule_list_update(first_index)
+
+    def _schedule_list_update(self, first_row: int = 0):
+        """
+        Refresh the annotation list once the current burst of signals is handled.
+
+        Layers emit one signal per annotation, so a bulk change would otherwise
+        rebuild the whole list for every annotation touched.
+
+        Args:
+            first_row (int): First row that changed. Rows before it are kept,
+                0 rebuilds the whole list.
+        """
+        if self._list_update_from is None:
+            self._list_update_from = first_row
+            QTimer.singleShot(0, self._flush_list_update)
+        else:
+            self._list_update_from = min(self._list_update_from, first_row)
+
+    def _flush_list_update(self):
+        first_row, self._list_update_from = self._list_update_from, None
+        if first_row:
+            self.annotation_list.update_rows_from(first_row)
+        else:
+            self.annotation_list.update_list()
+
+    def _emit_msg(self, msg: str):
+        """
+        Emit a status message, at most once per ~16 ms.
+
+        Mouse moves and bulk annotation updates produce messages far faster
+        than the status bar can usefully show them. Messages inside the window
+        are held back, and only the latest is emitted once it expires.
+
+        Args:
+            msg (str): The message to show.
+        """
+        self._pending_msg = msg
+        if self._msg_timer.elapsed() >= 16:
+            self._flush_msg()
+        elif not self._msg_flush_scheduled:
+            self._msg_flush_scheduled = True
+            QTimer.singleShot(16, self._flush_msg)
+
+    def _flush_msg(self):
+        self._msg_flush_scheduled = False
+        if self._pending_msg is None:
+            return
+        msg, self._pending_msg = self._pending_msg, None
+        self.messageSignal.emit(msg)
+        self._msg_timer.restart()
 
     def update_label_combo(self):
         """
         Add predefined labels to the label combo box.
 
-        This method is called when a new label is added.
+        This method is called when a new label is added. Items are updated in
+        place, only labels past the end of the combo are added and only
+        changed names or colours are touched. Each item keeps the rgba of its
+        icon as item data to tell.
         """
+        labels = self.config.predefined_labels
         with QSignalBlocker(self.label_combo):
-            self.label_combo.clear()
-            for label in self.config.predefined_labels:
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(label.color)
-                self.label_combo.addItem(QIcon(pixmap), label.name)
+            while self.label_combo.count() > len(labels):
+                self.label_combo.removeItem(self.label_combo.count() - 1)
+            for i, label in enumerate(labels):
+                rgba = label.color.rgba()
+                if i >= self.label_combo.count():
+                    self.label_combo.addItem(_color_icon(label.color), label.name, rgba)
+                    continue
+                if self.label_combo.itemText(i) != label.name:
+                    self.label_combo.setItemText(i, label.name)
+                if self.label_combo.itemData(i) != rgba:
+                    self.label_combo.setItemIcon(i, _color_icon(label.color))
+                    self.label_combo.setItemData(i, rgba)
         logger.info("Updated label combo box with predefined labels.")
         self.sync_label_combo_to_selection()
 
@@ -503,6 +1055,7 @@ class LayerifyTab(QWidget):
         return self.config.default_label
 
     def update_annotations_for_label_rename(self, old_label: str, new_label: str):
+        self._wait_for_saves()
         for layer in self.annotable_layers:
             changed = False
             for annotation in layer.annotations:
@@ -531,6 +1084,7 @@ class LayerifyTab(QWidget):
     def replace_deleted_label_in_annotations(
         self, deleted_label: str, replacement_label: Label
     ):
+        self._wait_for_saves()
         for layer in self.annotable_layers:
             changed = False
             for annotation in layer.annotations:
@@ -563,12 +1117,7 @@ class LayerifyTab(QWidget):
         if not current_label or not new_name or new_name == current_label:
             return False
 
-        existing_names = [
-            label.name
-            for label in self.config.predefined_labels
-            if label.name != current_label
-        ]
-        if new_name in existing_names:
+        if new_name in self._label_names:
             QMessageBox.warning(self, "Duplicate", "Label name already exists!")
             return False
 
@@ -584,6 +1133,7 @@ class LayerifyTab(QWidget):
             return False
 
         self.config.predefined_labels[target_index].name = new_name
+        self._refresh_label_names()
         self.update_annotations_for_label_rename(current_label, new_name)
         self.current_label = new_name
         if self.layer:
@@ -593,7 +1143,7 @@ class LayerifyTab(QWidget):
         new_index = self.label_combo.findText(new_name)
         if new_index >= 0:
             self.label_combo.setCurrentIndex(new_index)
-        self.annotation_list.update_list()
+        self._schedule_list_update()
         self.messageSignal.emit(f"Renamed label {current_label} to {new_name}")
         return True
 
@@ -639,11 +1189,13 @@ class LayerifyTab(QWidget):
             if result != QMessageBox.Yes:
                 return False
 
+        deleted_names = set(label_names)
         self.config.predefined_labels = [
             label
             for label in self.config.predefined_labels
-            if label.name not in set(label_names)
+            if label.name not in deleted_names
         ]
+        self._refresh_label_names()
         for label_name in label_names:
             self.replace_deleted_label_in_annotations(label_name, default_label)
         self.current_label = default_label.name
@@ -655,7 +1207,7 @@ class LayerifyTab(QWidget):
         default_index = self.label_combo.findText(default_label.name)
         if default_index >= 0:
             self.label_combo.setCurrentIndex(default_index)
-        self.annotation_list.update_list()
+        self._schedule_list_update()
         self.messageSignal.emit(f"Deleted {len(label_names)} label(s)")
         return True
 
@@ -785,6 +1337,9 @@ class LayerifyTab(QWidget):
             self.layer.set_mode(mode)
         self.sync_mode_buttons()
 
+    def _on_layer_mode_changed(self, _mode: MouseMode):
+        self.sync_mode_buttons()
+
     def sync_mode_buttons(self):
         if not self.mode_buttons or not self.layer:
             return
@@ -793,22 +1348,31 @@ class LayerifyTab(QWidget):
             button.setChecked(mode == self.layer.mouse_mode)
 
     def on_label_update(self, old_new_label: tuple[str, str]):
-        new_labels = []
-        index = 0
-        for i, label in enumerate(self.config.predefined_labels):
-            if label.name == old_new_label[0]:
-                label.name = old_new_label[1]
-                index = i
-            new_labels.append(label)
-
-        self.config.predefined_labels = new_labels
+        old_name, new_name = old_new_label
+        if old_name == new_name or old_name not in self._label_names:
+            return
+        index = next(
+            i
+            for i, label in enumerate(self.config.predefined_labels)
+            if label.name == old_name
+        )
+        # Rename in place; the combo items mirror predefined_labels by position,
+        # so only the renamed entry needs its text changed.
+        self.config.predefined_labels[index].name = new_name
+        with QSignalBlocker(self.label_combo):
+            self.label_combo.setItemText(index, new_name)
+
+        self._label_names.discard(old_name)
+        self._label_names.add(new_name)
+        if _KEY_0 + index in self._label_by_key:
+            self._label_by_key[_KEY_0 + index] = (index, new_name)
         logger.info(f"Updated label from {old_new_label[0]} to {old_new_label[1]}")
         self.messageSignal.emit(
             f"Updated label from {old_new_label[0]} to {old_new_label[1]}."
         )
 
-        self.update_label_combo()
         self.handle_label_change(index=index)
+        self.sync_label_combo_to_selection()
         self.label_combo.update()
 
     def load_default_image(self):
@@ -832,10 +1396,11 @@ class LayerifyTab(QWidget):
             logger.warning("No model selected to predict")
             self.messageSignal.emit("No model selected/or loaded to predict")
             return
-        # get image as an numpy array from canvas
-        image = qpixmap_to_numpy(self.layer.image)
-        if image is None:
+        # QPixmap is tied to the UI thread, so only the QImage handoff happens
+        # here, the worker converts it to a numpy array
+        if self.layer.image.isNull():
             return
+        image = self.layer.image.toImage()
         # get annotations from canvas
         annotations = [
             ann
@@ -848,31 +1413,22 @@ class LayerifyTab(QWidget):
             self.messageSignal.emit("No annotations to predict passing image to model")
             # return
 
-        points = []
-        polygons = []
-        rectangles = []
-        label_hints = []
+        # Prompts are handed to the worker as numpy arrays: rectangles as a
+        # (1, N, 4) x1, y1, x2, y2 batch, points and polygons as
+        # (values, offsets) pairs since they are ragged. The per-annotation
+        # arrays are cached on the annotations between predictions
+        points = [ann.points_array() for ann in annotations if ann.points]
+        polygons = [ann.polygon_array() for ann in annotations if ann.polygon]
+        rectangles = [ann.rectangle_xyxy() for ann in annotations if ann.rectangle]
         for ann in annotations:
-            if ann.points:
-                points.append([[p.x(), p.y()] for p in ann.points])
-            if ann.polygon:
-                polygons.append([[p.x(), p.y()] for p in ann.polygon])
-            if ann.rectangle:
-                rectangles.append(
-                    [
-                        ann.rectangle.x(),
-                        ann.rectangle.y(),
-                        ann.rectangle.x() + ann.rectangle.width(),
-                        ann.rectangle.y() + ann.rectangle.height(),
-                    ]
-                )
-            label_hints.append([0])
             ann.visible = False
 
-        points = points if len(points) > 0 else None
-        polygons = polygons if len(polygons) > 0 else None
-        rectangles = [rectangles] if len(rectangles) > 0 else None
-        label_hints = label_hints if len(label_hints) > 0 else None
+        points = qpointlists_to_csr(points) if points else None
+        polygons = qpointlists_to_csr(polygons) if polygons else None
+        rectangles = np.stack(rectangles)[None] if rectangles else None
+        label_hints = (
+            np.zeros((len(annotations), 1), dtype=np.int64) if annotations else None
+        )
 
         self.loading_dialog = QProgressDialog(
             "Processing annotation...",
@@ -884,31 +1440,14 @@ class LayerifyTab(QWidget):
         self.loading_dialog.setWindowTitle("Please Wait")
         self.loading_dialog.setWindowModality(Qt.WindowModal)
         self.loading_dialog.setCancelButton(None)  # Remove cancel button if not needed
+        # The image conversion and the model both run on the worker thread, the
+        # dialog is painted by the event loop once this returns
         self.loading_dialog.show()
 
-        # Force UI update
-        QApplication.processEvents()
-
-        # Setup worker thread
-        self.worker_thread = QThread()
-        self.worker = ModelPredictionWorker(
+        # Hand the job to the persistent prediction worker
+        self.predictionRequested.emit(
             self.current_model, image, points, polygons, rectangles, label_hints
         )
-        self.worker.moveToThread(self.worker_thread)
-
-        # Connect signals
-        self.worker_thread.started.connect(self.worker.process)
-        self.worker.finished.connect(self.handle_model_result)
-        self.worker.finished.connect(self.worker_thread.quit)
-        self.worker.error.connect(self.handle_model_error)
-
-        # Cleanup connections
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.worker_thread.finished.connect(self.worker_thread.deleteLater)
-        self.worker_thread.finished.connect(self.loading_dialog.close)
-
-        # Start processing
-        self.worker_thread.start()
 
     def handle_model_result(self, predictions: list[PredictionResult]):
         """
@@ -917,68 +1456,56 @@ class LayerifyTab(QWidget):
         Args:
             predictions (list[PredictionResult]): The list of prediction results.
         """
+        self.loading_dialog.close()
+        color_by_label = {
+            label.name: label.color for label in self.config.predefined_labels
+        }
+        first_new_id = annotation_id = len(self.layer.annotations)
+        annotator = self.current_model.name
+        file_path = self.layer.file_path
+        annotations = self.layer.annotations
+        labels_added = False
         # update canvas with predictions
         for prediction in predictions:
-            if prediction.class_name not in self.config.predefined_labels:
-                self.config.predefined_labels.append(Label(prediction.class_name))
-                self.update_label_combo()
+            # new labels are registered as they appear, the combo is
+            # refreshed once after the batch
+            labels_added = (
+                self.ensure_label_available(prediction.class_name) or labels_added
+            )
+            common = {
+                "annotation_id": annotation_id,
+                "label": prediction.class_name,
+                "color": color_by_label.get(prediction.class_name, _WHITE),
+                "is_complete": True,
+                "score": prediction.score,
+                "annotator": annotator,
+                "annotation_time": str(prediction.annotation_time or ""),
+                "file_path": file_path,
+            }
             if prediction.rectangle:
                 # make sure the returned rectangle is within the image
-
-                self.layer.annotations.append(
-                    Annotation(
-                        annotation_id=len(self.layer.annotations),
-                        label=prediction.class_name,
-                        color=self.config.get_label_color(prediction.class_name)
-                        or QColor(255, 255, 255),
-                        rectangle=QRectF(*prediction.rectangle),
-                        is_complete=True,
-                        score=prediction.score,
-                        annotator=self.current_model.name,
-                        annotation_time=str(
-                            prediction.annotation_time
-                            if prediction.annotation_time
-                            else ""
-                        ),
-                        file_path=self.layer.file_path,
-                    )
+                annotations.append(
+                    Annotation(rectangle=QRectF(*prediction.rectangle), **common)
                 )
             elif prediction.polygon is not None:
-                self.layer.annotations.append(
+                annotations.append(
                     Annotation(
-                        annotation_id=len(self.layer.annotations),
-                        label=prediction.class_name,
-                        color=self.config.get_label_color(prediction.class_name)
-                        or QColor(255, 255, 255),
                         polygon=QPolygonF([QPointF(*p) for p in prediction.polygon]),
-                        is_complete=True,
-                        score=prediction.score,
-                        annotator=self.current_model.name,
-                        annotation_time=str(prediction.annotation_time),
-                        file_path=self.layer.file_path,
+                        **common,
                     )
                 )
             else:
                 # points as center of canvas
                 x, y = self.layer.width() // 2, self.layer.height() // 2
-                self.layer.annotations.append(
-                    Annotation(
-                        annotation_id=len(self.layer.annotations),
-                        label=prediction.class_name,
-                        color=self.config.get_label_color(prediction.class_name)
-                        or QColor(255, 255, 255),
-                        points=[QPointF(x, y)],
-                        is_complete=True,
-                        score=prediction.score,
-                        annotator=self.current_model.name,
-                        annotation_time=str(prediction.annotation_time),
-                        file_path=self.layer.file_path,
-                    )
-                )
+                annotations.append(Annotation(points=[QPointF(x, y)], **common))
+            annotation_id += 1
 
+        if labels_added:
+            self.update_label_combo()
         self.layer.update()
-        self.annotation_list.update_list()
-        self.update_annotation_list()
+        self.annotation_list.append_annotations(
+            self.layer.annotations[first_new_id:]
+        )
 
     def handle_model_change(self, index):
         """
@@ -1095,6 +1622,10 @@ class LayerifyTab(QWidget):
         )
 
         if file_name:
+            # write queued edits of the annotations being replaced now, a later
+            # flush would save whatever the layer holds then, e.g. the empty
+            # list of a failed load, and delete the cache file
+            self._wait_for_saves()
             try:
                 self.layer.annotations = Annotation.load_from_json(file_name)
                 self.layer.update()
@@ -1112,7 +1643,7 @@ class LayerifyTab(QWidget):
 
     def update_annotation_list(self):
         """Update the annotation list with the current annotations."""
-        self.annotation_list.update_list()
+        self._schedule_list_update()
 
     def choose_color(self):
         """Choose a color for the current label."""
@@ -1133,15 +1664,13 @@ class LayerifyTab(QWidget):
                 label_info.color = color
                 # Update combo box display
                 index = self.label_combo.currentIndex()
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(color)
-                self.label_combo.setItemIcon(index, QIcon(pixmap))
+                self.label_combo.setItemIcon(index, _color_icon(color))
+                self.label_combo.setItemData(index, color.rgba())
                 # Update canvas color
                 self.layer.current_color = color
-                self.layer.update()
-        for annotation in self.layer.annotations:
-            if annotation.label == current_label:
-                annotation.color = color
+                for annotation in self.layer.annotations:
+                    if annotation.label == current_label:
+                        annotation.color = color
                 self.layer.update()
 
     def add_new_label(self):
@@ -1151,8 +1680,7 @@ class LayerifyTab(QWidget):
             return
 
         # Check for existing label
-        existing_names = [label.name for label in self.config.predefined_labels]
-        if name in existing_names:
+        if name in self._label_names:
             QMessageBox.warning(self, "Duplicate", "Label name already exists!")
             return
 
@@ -1183,16 +1711,19 @@ class LayerifyTab(QWidget):
             self.current_label if self.current_label != "Custom" else None
         )
         msg = f"Label changed to {self.current_label}"
-        self.messageSignal.emit(msg)
+        self._emit_msg(msg)
         selected_annotation = self.layer._get_selected_annotation()
         self.layer.selected_annotation = selected_annotation
-        if selected_annotation:
+        # an annotation that already carries the label needs no save or refresh
+        if selected_annotation and (
+            selected_annotation.label != label_info.name
+            or selected_annotation.color != label_info.color
+        ):
             selected_annotation.label = label_info.name
             selected_annotation.color = label_info.color
             self.on_annotation_updated(selected_annotation)
 
         self.layer.update()
-        self.update()
 
     def add_layer(self, layer):
         """Add a new layer to the tab."""
@@ -1269,9 +1800,9 @@ class LayerifyTab(QWidget):
         self.label_combo = QComboBox()
         self.label_combo.setStyleSheet("QComboBox { min-width: 120px; }")
         for label in self.config.predefined_labels:
-            pixmap = QPixmap(16, 16)
-            pixmap.fill(label.color)
-            self.label_combo.addItem(QIcon(pixmap), label.name)
+            self.label_combo.addItem(
+                _color_icon(label.color), label.name, label.color.rgba()
+            )
         self.label_combo.currentIndexChanged.connect(self.handle_label_change)
         toolbar_layout.addWidget(self.label_combo)
 
@@ -1291,37 +1822,26 @@ class LayerifyTab(QWidget):
         """Load images from a folder and update the image list."""
         self.image_entries = []  # Clear the existing image paths
 
-        if self.config.full_search:
-            image_paths = list(folder_path.rglob("*.*"))
-        else:
-            image_paths = list(folder_path.glob("*.*"))
-
-        for img_path in image_paths:
-            if img_path.suffix.lower() in [
-                ".jpg",
-                ".jpeg",
-                ".png",
-                ".bmp",
-                ".tiff",
-            ]:
+        for img_path in _iter_images(folder_path, recursive=self.config.full_search):
+            self.image_entries.append(ImageEntry(is_baked_result=False, data=img_path))
+
+        # load from bake folder if it exists and was not walked above already
+        bake_folder = self.config.bake_dir
+        if bake_folder.is_dir() and not self._folder_scanned(bake_folder, folder_path):
+            for img_path in _iter_images(bake_folder):
                 self.image_entries.append(
                     ImageEntry(is_baked_result=False, data=img_path)
                 )
 
-        # load from bake folder if it exists
-        bake_folder = self.config.bake_dir
-        if bake_folder.exists() and bake_folder.is_dir():
-            for img_path in bake_folder.glob("*.*"):
-                if img_path.suffix.lower() in [
-                    ".jpg",
-                    ".jpeg",
-                    ".png",
-                    ".bmp",
-                    ".tiff",
-                ]:
-                    self.image_entries.append(
-                        ImageEntry(is_baked_result=False, data=img_path)
-                    )
+        self._rebuild_entry_index()
+
+    def _folder_scanned(self, folder: Path, scanned_root: Path) -> bool:
+        """Whether loading scanned_root already walked every file of folder."""
+        folder = folder.resolve()
+        scanned_root = scanned_root.resolve()
+        if folder == scanned_root:
+            return True
+        return self.config.full_search and folder.is_relative_to(scanned_root)
 
     def select_folder(self):
         """Allow the user to select a folder and load images from it."""
@@ -1356,55 +1876,98 @@ class LayerifyTab(QWidget):
         logger.warning(f"Tab {id(self)} deleted")
 
     def add_baked_result(self, baking_result: BakingResult):
-        """Add a baked result to the baked results list and update the image list."""
+        """
+        Save a baked result and add it to the image entries.
+
+        The image and annotations are written on the global thread pool, the
+        entry is added once they are on disk, see _on_baked_result_saved.
+        """
         try:
-            self.layer.setVisible(False)  # Hide the current layer
             filename = Path(baking_result.filename)
             filepath = self.config.bake_dir / filename.name
-            baking_result.image.save(str(filepath))
-            Annotation.save_as_json(
-                baking_result.annotations, self._cache_path_for_file(filepath)
-            )
-            self.sync_labels_from_annotations(
-                [annotation.copy() for annotation in baking_result.annotations]
+            QThreadPool.globalInstance().start(
+                _SaveBakedResultTask(
+                    baking_result.image,
+                    filepath,
+                    baking_result.annotations,
+                    self._cache_path_for_file(filepath),
+                    self.image_list_panel.thumbnail_size,
+                    self._baked_signals,
+                )
             )
+        except Exception as e:
+            logger.exception(f"Failed to add baked result: {e}")
+            self.messageSignal.emit(f"Failed to add baked result: {e}")
 
-            baked_result_entry = ImageEntry(is_baked_result=True, data=filepath)
-            self.image_entries.append(baked_result_entry)
+    def _on_baked_result_saved(
+        self,
+        filepath: Path,
+        annotations: list[Annotation],
+        image: QImage,
+        thumbnail: QImage,
+    ):
+        self.sync_labels_from_annotations(annotations)
+        # the result is selected once added, showing it must not read back
+        # the file that was just written
+        self._cache_pixmap(filepath, QPixmap.fromImage(image))
+        self.image_list_panel.cache_thumbnail(str(filepath), thumbnail)
+        baked_result_entry = ImageEntry(is_baked_result=True, data=filepath)
+        self.image_entries.append(baked_result_entry)
+        self._entry_index[id(baked_result_entry)] = len(self.image_entries) - 1
+
+        logger.info("A baked result has arrived, adding it to the image list.")
+        self._pending_baked.append(baked_result_entry)
+        if len(self._pending_baked) >= self.baked_batch_max:
+            self._baked_timer.stop()
+            self._flush_baked_results()
+        elif not self._baked_timer.isActive():
+            self._baked_timer.start()
+
+    def _on_baked_result_failed(self, filepath: Path, error: str):
+        self.messageSignal.emit(f"Failed to add baked result {filepath.name}: {error}")
+
+    def _flush_baked_results(self):
+        """Refresh the image list once for the pending baked results."""
+        if not self._pending_baked:
+            return
+        new_entries = list(self._pending_baked)
+        self._pending_baked.clear()
+        num_added = len(new_entries)
 
-            logger.info("A baked result has arrived, adding it to the image list.")
-            page_index = (len(self.image_entries) - 1) // self.config.deque_maxlen
-            self.image_list_panel.image_entries = self.image_entries
-            self.image_list_panel.current_page = page_index
-            self.image_list_panel.update_image_list(self.image_entries)
-            self.image_list_panel.imageSelected.emit(baked_result_entry)
+        self._show_layer(None)  # Hide the current layer
+        self.image_list_panel.image_entries = self.image_entries
+        self.image_list_panel.append_image_entries(new_entries)
+        self.image_list_panel.imageSelected.emit(new_entries[-1])
 
+        if num_added == 1:
             self.messageSignal.emit("Baked result added")
+        else:
+            self.messageSignal.emit(f"{num_added} baked results added")
+        # this tab is only visible while it is the current one
+        if not self.isVisible():
             self.gotToTab.emit(0)
-        except Exception as e:
-            logger.exception(f"Failed to add baked result: {e}")
-            self.messageSignal.emit(f"Failed to add baked result: {e}")
 
     def keyPressEvent(self, event):
         """Handle key press events for setting labels and deleting annotations."""
         key = event.key()
+        handled = False
 
         # Debugging: Log the key press
-        logger.info(f"Key pressed in LayerifyTab: {key}")
+        logger.debug(f"Key pressed in LayerifyTab: {key}")
         if event.modifiers() == Qt.ControlModifier:
             if key == Qt.Key_Z:
                 self.layer.undo()
-                self.annotation_list.update_list()
+                self._schedule_list_update()
                 event.accept()
                 return
             if key == Qt.Key_Y:
                 self.layer.redo()
-                self.annotation_list.update_list()
+                self._schedule_list_update()
                 event.accept()
                 return
             if key == Qt.Key_A:
                 self.layer.select_all_annotations()
-                self.annotation_list.update_list()
+                self._schedule_list_update()
                 event.accept()
                 return
             if key == Qt.Key_C:
@@ -1413,84 +1976,128 @@ class LayerifyTab(QWidget):
                 return
             if key == Qt.Key_V:
                 self.layer.paste_annotation()
-                self.annotation_list.update_list()
+                self._schedule_list_update()
                 event.accept()
                 return
 
         # only if no modifier keys are pressed
         if event.modifiers() == Qt.NoModifier:
-            # Handle keys 0-9 for setting labels
-            if Qt.Key_0 <= key <= Qt.Key_9:
-                label_index = key - Qt.Key_0  # Convert key to index (0-9)
-                if label_index < len(self.config.predefined_labels):
-                    # Set the current label to the corresponding predefined label
-                    self.current_label = self.config.predefined_labels[label_index].name
-                    self.label_combo.setCurrentIndex(label_index)
-                    self.layer.current_label = self.current_label
-                    self.layer.update()
+            # Holding a shortcut key repeats the same state change, only the
+            # first press needs to do the work. Other keys, e.g. arrows, keep
+            # repeating into the annotation list and the base class
+            if (
+                event.isAutoRepeat()
+                and key == self._last_key
+                and self._is_shortcut_key(key)
+            ):
+                event.accept()
+                return
+            self._last_key = key
+            handled = True
+
+            # Handle keys 0-9 for setting labels, then the single-key shortcuts
+            label_target = self._label_by_key.get(key)
+            if label_target is not None:
+                label_index, label_name = label_target
+                if not self._label_key_applied(label_index, label_name):
+                    # Set the current label to the corresponding predefined label.
+                    # The combo is moved silently and the label applied once,
+                    # handle_label_change also sets the colour and repaints
+                    with QSignalBlocker(self.label_combo):
+                        self.label_combo.setCurrentIndex(label_index)
+                    self.handle_label_change(label_index)
                     logger.info(f"Label set to: {self.current_label}")
-                else:
-                    # Show dialog to add a new label if the index is out of range
-                    self.add_new_label()
-
-            # Handle Delete key for removing the selected annotation
-            elif key == Qt.Key_Delete:
-                if self.layer:
-                    self.layer.delete_selected_annotations()
-                    self.annotation_list.update_list()
-                    logger.info("Selected annotation deleted.")
-
-            # if clicked q, set the mode to point
-            elif key == Qt.Key_Q:
-                self.set_annotation_mode(MouseMode.POINT)
-                logger.info("Mouse mode set to POINT.")
-            # if clicked w, set the mode to polygon
-            elif key == Qt.Key_W:
-                self.set_annotation_mode(MouseMode.POLYGON)
-                logger.info("Mouse mode set to POLYGON.")
-            # if clicked e, set the mode to rectangle
-            elif key == Qt.Key_E:
-                self.set_annotation_mode(MouseMode.RECTANGLE)
-                logger.info("Mouse mode set to RECTANGLE.")
-                # if pressed h key, then toggle visibility of annotations
-            elif event.key() == Qt.Key_H:
-                self.layer.toggle_annotation_visibility()
-
-            # if selected l, then run layerify the selected annotations
-            elif event.key() == Qt.Key_L:
-                if self.layer and self.layer.annotations:
-                    selected_annotations = [
-                        ann for ann in self.layer.annotations if ann.selected
-                    ]
-                    if selected_annotations:
-                        logger.info(
-                            f"Layerifying {len(selected_annotations)} selected annotations."
-                        )
-                        self.layer.layerify_annotation(selected_annotations)
-                    else:
-                        # layerify all annotations in the current layer
-                        self.layer.layerify_annotation(self.layer.annotations)
-                    logger.info("Layerified all annotations in the current layer.")
-                else:
-                    logger.warning("No annotations to layerify.")
-            elif event.key() == Qt.Key_C:
-                # if an annotation is selected, open a dialog box
-                # in that dialog box, ask for a caption
-                self.layer.selected_annotation = self.layer._get_selected_annotation()
-                if self.layer.selected_annotation:
-                    current_caption = getattr(
-                        self.layer.selected_annotation, "caption", ""
-                    )
-                    text, ok = QInputDialog.getMultiLineText(
-                        self, "Edit Caption", "Enter caption:", current_caption
-                    )
-                    if ok:
-                        self.layer.selected_annotation.caption = text
-                        self.layer.update()
+            elif _KEY_0 <= key <= _KEY_9:
+                # Show dialog to add a new label if the index is out of range
+                self.add_new_label()
+            elif key in self._key_handlers:
+                self._key_handlers[key]()
+            else:
+                handled = False
 
-            # Pass the event to the annotation list if it needs to handle it
-            if self.annotation_list.hasFocus():
+            # Pass the event to the annotation list if it needs to handle it,
+            # keys handled above would otherwise act twice, e.g. H toggling
+            # visibility back
+            if not handled and self.annotation_list.hasFocus():
                 self.annotation_list.keyPressEvent(event)
 
-        # Pass unhandled events to the base class
-        super().keyPressEvent(event)
+        if handled:
+            event.accept()
+        else:
+            # Pass unhandled events to the base class
+            super().keyPressEvent(event)
+
+    def _is_shortcut_key(self, key: int) -> bool:
+        """Whether keyPressEvent handles key itself when no modifier is held."""
+        return (
+            key in self._key_handlers
+            or key in self._label_by_key
+            or _KEY_0 <= key <= _KEY_9
+        )
+
+    def _label_key_applied(self, label_index: int, label_name: str) -> bool:
+        """
+        Whether pressing the key for a label would change nothing.
+
+        The combo follows the selected annotation, see
+        sync_label_combo_to_selection, so it is compared together with the
+        selected annotation's label rather than with layer.current_label.
+        """
+        if label_index != self.label_combo.currentIndex():
+            return False
+        if label_name != self.layer.current_label:
+            return False
+        selected_annotation = self.layer._get_selected_annotation()
+        return selected_annotation is None or selected_annotation.label == label_name
+
+    def keyReleaseEvent(self, event):
+        """Forget the held key once it is actually released."""
+        if not event.isAutoRepeat():
+            self._last_key = None
+        super().keyReleaseEvent(event)
+
+    def _delete_selected(self):
+        """Delete the selected annotations, bound to the Delete key."""
+        if self.layer:
+            # the layer's annotationRemoved refreshes the affected rows
+            self.layer.delete_selected_annotations()
+            logger.info("Selected annotation deleted.")
+
+    def _set_mode_from_key(self, mode: MouseMode):
+        """Switch the annotation mode, bound to Q, W and E."""
+        self.set_annotation_mode(mode)
+        logger.info(f"Mouse mode set to {mode.name}.")
+
+    def _toggle_annotation_visibility(self):
+        """Toggle the visibility of the annotations, bound to H."""
+        self.layer.toggle_annotation_visibility()
+
+    def _layerify_selected(self):
+        """Layerify the selected annotations, or all of them, bound to L."""
+        if self.layer and self.layer.annotations:
+            selected_annotations = [
+                ann for ann in self.layer.annotations if ann.selected
+            ]
+            if selected_annotations:
+                logger.info(
+                    f"Layerifying {len(selected_annotations)} selected annotations."
+                )
+                self.layer.layerify_annotation(selected_annotations)
+            else:
+                # layerify all annotations in the current layer
+                self.layer.layerify_annotation(self.layer.annotations)
+            logger.info("Layerified all annotations in the current layer.")
+        else:
+            logger.warning("No annotations to layerify.")
+
+    def _edit_selected_caption(self):
+        """Ask for a caption for the selected annotation, bound to C."""
+        self.layer.selected_annotation = self.layer._get_selected_annotation()
+        if self.layer.selected_annotation:
+            current_caption = getattr(self.layer.selected_annotation, "caption", "")
+            text, ok = QInputDialog.getMultiLineText(
+                self, "Edit Caption", "Enter caption:", current_caption
+            )
+            if ok:
+                self.layer.selected_annotation.caption = text
+                self.layer.update()
@@ -1,8 +1,9 @@
 import cv2
 import numpy as np
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QPointF
+from PySide6.QtGui import QImage, QPixmap, QPolygonF
 
-from imagebaker.core.defs.defs import Annotation
+from imagebaker.core.defs.defs import Annotation, qpointlist_to_ndarray
 
 
 def qpixmap_to_numpy(pixmap: QPixmap | QImage) -> np.ndarray:
@@ -28,14 +29,36 @@ def qpixmap_to_numpy(pixmap: QPixmap | QImage) -> np.ndarray:
     width = image.width()
     height = image.height()
 
-    # Get the bytes directly from the QImage
-    ptr = image.constBits()
+    # View the pixel buffer in place, dropping any row padding, and take a
+    # single owning copy so the array does not depend on the QImage lifetime
+    arr = np.frombuffer(image.constBits(), dtype=np.uint8)
+    arr = arr.reshape((height, image.bytesPerLine()))[:, : width * 4]
 
-    # Convert memoryview to bytes and then to numpy array
-    bytes_data = bytes(ptr)
-    arr = np.frombuffer(bytes_data, dtype=np.uint8).reshape((height, width, 4))
+    return arr.reshape((height, width, 4)).copy()
 
-    return arr
+
+def qpointlists_to_csr(
+    point_lists: list[list[QPointF] | QPolygonF | np.ndarray],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack ragged point sequences into one coordinate array plus offsets.
+
+    Args:
+        point_lists: List of QPointF lists, QPolygonFs or (N, 2) arrays
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: float32 array of shape (K, 2) with
+            all points, and int32 offsets of shape (N + 1,) where sequence i is
+            values[offsets[i]:offsets[i + 1]]
+    """
+    offsets = np.zeros(len(point_lists) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(points) for points in point_lists])
+    values = np.empty((offsets[-1], 2), dtype=np.float32)
+    for i, points in enumerate(point_lists):
+        if not isinstance(points, np.ndarray):
+            points = qpointlist_to_ndarray(points)
+        values[offsets[i] : offsets[i + 1]] = points
+    return values, offsets
 
 
 def draw_annotations(image: np.ndarray, annotations: list[Annotation]) -> np.ndarray:
@@ -50,57 +73,61 @@ def draw_annotations(image: np.ndarray, annotations: list[Annotation]) -> np.nda
         np.ndarray: Image with annotations drawn.
     """
     color = (0, 255, 0, 255) if image.shape[2] == 4 else (0, 255, 0)
+    font = cv2.FONT_HERSHEY_SIMPLEX
 
-    for i, ann in enumerate(annotations):
+    # the geometry arrays come from the annotation's own caches, so redrawing
+    # unchanged annotations skips the conversion from Qt points
+    for ann in annotations:
         if ann.rectangle:
             # if image has alpha channel, make color full alpha
-            cv2.rectangle(
-                image,
-                (int(ann.rectangle.x()), int(ann.rectangle.y())),
-                (
-                    int(ann.rectangle.x() + ann.rectangle.width()),
-                    int(ann.rectangle.y() + ann.rectangle.height()),
-                ),
-                color,
-                2,
-            )
-            rect_center = ann.rectangle.center()
+            xyxy = ann.rectangle_xyxy()
+            x1, y1, x2, y2 = xyxy.astype(np.int32).tolist()
+            cv2.rectangle(image, (x1, y1), (x2, y2), color, 2)
+            rect_center = ((xyxy[:2] + xyxy[2:]) / 2).astype(np.int32).tolist()
 
             cv2.putText(
                 image,
                 ann.label,
-                (int(rect_center.x()), int(rect_center.y())),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                tuple(rect_center),
+                font,
                 1,
                 color,
                 2,
             )
         elif ann.polygon:
+            # astype truncates toward zero like int() did per coordinate
+            polygon_array = ann.polygon_array()
+            polygon = polygon_array.astype(np.int32)
             cv2.polylines(
                 image,
-                [np.array([[int(p.x()), int(p.y())] for p in ann.polygon])],
+                [polygon.reshape(-1, 1, 2)],
                 True,
                 color,
                 2,
             )
-            polygon_center = ann.polygon.boundingRect().center()
+            polygon_center = (
+                ((polygon_array.min(axis=0) + polygon_array.max(axis=0)) / 2)
+                .astype(np.int32)
+                .tolist()
+            )
             cv2.putText(
                 image,
                 ann.label,
-                (int(polygon_center.x()), int(polygon_center.y())),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                tuple(polygon_center),
+                font,
                 1,
                 color,
                 2,
             )
         elif ann.points:
-            for p in ann.points:
-                cv2.circle(image, (int(p.x()), int(p.y())), 5, color, -1)
+            points = ann.points_array().astype(np.int32).tolist()
+            for x, y in points:
+                cv2.circle(image, (x, y), 5, color, -1)
             cv2.putText(
                 image,
                 ann.label,
-                (int(ann.points[0].x()), int(ann.points[0].y())),
-                cv2.FONT_HERSHEY_SIMPLEX,
+                tuple(points[0]),
+                font,
                 1,
                 color,
                 2,
@@ -1,3 +1,4 @@
+import numpy as np
 from PySide6.QtCore import QPointF
 
 from imagebaker.core.defs import DrawingState, LayerState
@@ -18,81 +19,70 @@ def calculate_intermediate_states(
     if not previous_state or not current_state:
         return [current_state]  # If no previous state, return only the current state
 
+    # fractions 1/steps .. 1, all numeric fields of all steps in one operation
+    t = np.arange(1, steps + 1, dtype=np.float64) / steps
+    start = previous_state.to_vec()
+    vectors = start + (current_state.to_vec() - start) * t[:, None]
+
+    # fields that are the same for every step
+    layer_id = current_state.layer_id
+    layer_name = current_state.layer_name
+    order = current_state.order
+    visible = current_state.visible
+    allow_annotation_export = current_state.allow_annotation_export
+    playing = current_state.playing
+    is_annotable = current_state.is_annotable
+    status = current_state.status
+    caption = previous_state.caption  # Assuming caption is the same in both states
+    # the strokes are copied once, every step gets its own list of the copies
+    drawing_states = [
+        DrawingState(
+            position=d.position,
+            color=d.color,
+            size=d.size,
+        )
+        for d in current_state.drawing_states
+    ]
+
     intermediate_states = []
-    for i in range(1, steps + 1):
-        # Interpolate attributes between previous_state and current_state
+    for (
+        opacity,
+        rotation,
+        scale,
+        scale_x,
+        scale_y,
+        position_x,
+        position_y,
+        origin_x,
+        origin_y,
+        edge_opacity,
+        edge_width,
+    ) in vectors.tolist():
         interpolated_state = LayerState(
-            layer_id=current_state.layer_id,
-            layer_name=current_state.layer_name,
-            opacity=previous_state.opacity
-            + (current_state.opacity - previous_state.opacity) * (i / steps),
-            position=QPointF(
-                previous_state.position.x()
-                + (current_state.position.x() - previous_state.position.x())
-                * (i / steps),
-                previous_state.position.y()
-                + (current_state.position.y() - previous_state.position.y())
-                * (i / steps),
-            ),
-            rotation=previous_state.rotation
-            + (current_state.rotation - previous_state.rotation) * (i / steps),
-            scale=previous_state.scale
-            + (current_state.scale - previous_state.scale) * (i / steps),
-            scale_x=previous_state.scale_x
-            + (current_state.scale_x - previous_state.scale_x) * (i / steps),
-            scale_y=previous_state.scale_y
-            + (current_state.scale_y - previous_state.scale_y) * (i / steps),
-            transform_origin=QPointF(
-                previous_state.transform_origin.x()
-                + (
-                    current_state.transform_origin.x()
-                    - previous_state.transform_origin.x()
-                )
-                * (i / steps),
-                previous_state.transform_origin.y()
-                + (
-                    current_state.transform_origin.y()
-                    - previous_state.transform_origin.y()
-                )
-                * (i / steps),
-            ),
-            order=current_state.order,
-            visible=current_state.visible,
-            allow_annotation_export=current_state.allow_annotation_export,
-            playing=current_state.playing,
+            layer_id=layer_id,
+            layer_name=layer_name,
+            opacity=opacity,
+            position=QPointF(position_x, position_y),
+            rotation=rotation,
+            scale=scale,
+            scale_x=scale_x,
+            scale_y=scale_y,
+            transform_origin=QPointF(origin_x, origin_y),
+            order=order,
+            visible=visible,
+            allow_annotation_export=allow_annotation_export,
+            playing=playing,
             selected=False,
-            is_annotable=current_state.is_annotable,
-            status=current_state.status,
-            edge_opacity=previous_state.edge_opacity
-            + (current_state.edge_opacity - previous_state.edge_opacity) * (i / steps),
-            edge_width=previous_state.edge_width
-            + (current_state.edge_width - previous_state.edge_width) * (i / steps),
-            caption=previous_state.caption,  # Assuming caption is the same in both states
+            is_annotable=is_annotable,
+            status=status,
+            edge_opacity=edge_opacity,
+            edge_width=edge_width,
+            caption=caption,
+            drawing_states=list(drawing_states),
         )
-
-        # Deep copy the drawing_states from the previous_state
-        interpolated_state.drawing_states = [
-            DrawingState(
-                position=d.position,
-                color=d.color,
-                size=d.size,
-            )
-            for d in current_state.drawing_states
-        ]
-
         intermediate_states.append(interpolated_state)
 
-    # Append the current state as the final state
-    current_state.drawing_states.extend(
-        [
-            DrawingState(
-                position=d.position,
-                color=d.color,
-                size=d.size,
-            )
-            for d in current_state.drawing_states
-        ]
-    )
+    # Append the current state as the final state, it keeps its own strokes
     intermediate_states.append(current_state)
 
     return intermediate_states
@@ -22,20 +22,15 @@ def mask_to_polygons(
     Returns:
         List[List[Tuple[int, int]]]: List of polygons, each represented as a list of (x, y) points.
     """
-    contours, _ = cv2.findContours(
-        mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-    )
+    mask = mask.astype(np.uint8, copy=False)
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
+    # each contour's area is measured once, for the filter and the sort
     polygons = []
     for contour in contours:
         area = cv2.contourArea(contour)
         if area >= min_polygon_area:
-            polygons.append(contour)
-
-    # Sort polygons by area (descending)
-    polygons = sorted(
-        polygons, key=lambda p: cv2.contourArea(np.array(p)), reverse=True
-    )
+            polygons.append((area, contour))
 
     # Merge polygons if requested
     if merge_polygons and len(polygons) > 1:
@@ -43,28 +38,30 @@ def mask_to_polygons(
         kernel = np.ones((merge_distance, merge_distance), np.uint8)
         merged_mask = cv2.dilate(mask, kernel, iterations=1)
 
-        # Re-extract contours after merging
+        # Re-extract contours after merging, the first pass is only needed to
+        # know whether there is anything to merge, so it is not sorted
         merged_contours, _ = cv2.findContours(
-            merged_mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            merged_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
 
         # Filter again by area
-        merged_polygons = []
-        for contour in merged_contours:
-            area = cv2.contourArea(contour)
-            if area >= min_polygon_area:
-                merged_polygons.append(contour)
-
-        polygons = merged_polygons
-
-    # Convert contours to list of points
-    result = []
-    for poly in polygons:
-        points = poly.squeeze().tolist()  # Remove extra dimensions
-        if len(points) >= 3:  # Ensure it's a valid polygon
-            result.append([(int(x), int(y)) for x, y in points])
-
-    return result
+        polygons = [
+            contour
+            for contour in merged_contours
+            if cv2.contourArea(contour) >= min_polygon_area
+        ]
+    else:
+        # Sort polygons by area (descending)
+        polygons.sort(key=lambda item: item[0], reverse=True)
+        polygons = [contour for _, contour in polygons]
+
+    # Convert contours to list of points, contours are already (N, 1, 2) int32
+    # so tolist yields Python ints and only the pairs need turning into tuples
+    return [
+        list(map(tuple, poly.reshape(-1, 2).tolist()))
+        for poly in polygons
+        if len(poly) >= 3  # Ensure it's a valid polygon
+    ]
 
 
 def mask_to_rectangles(
@@ -87,21 +84,22 @@ def mask_to_rectangles(
         List[Tuple[int, int, int, int]]: List of rectangles, each as (x, y, w, h).
     """
     contours, _ = cv2.findContours(
-        mask.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        mask.astype(np.uint8, copy=False), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
     )
 
-    rectangles = []
-    for contour in contours:
-        x, y, w, h = cv2.boundingRect(contour)
-        rectangles.append((x, y, w, h))
+    # boundingRect already returns an (x, y, w, h) tuple of ints
+    rectangles = [cv2.boundingRect(contour) for contour in contours]
 
     if merge_rectangles and len(rectangles) > 1:
-        # Convert rectangles to the format expected by groupRectangles
-        rects = np.array(rectangles)
-        # groupRectangles requires [x, y, w, h] format
+        # groupRectangles takes the [x, y, w, h] tuples as they are. It only
+        # keeps clusters with more than merge_threshold members, so with the
+        # default of 1 a rectangle that overlaps nothing is dropped.
         grouped_rects, _ = cv2.groupRectangles(
-            rects.tolist(), merge_threshold, merge_epsilon
+            rectangles, merge_threshold, merge_epsilon
         )
-        rectangles = [tuple(map(int, rect)) for rect in grouped_rects]
+        # an empty tuple comes back when no cluster is kept
+        rectangles = [
+            tuple(rect) for rect in np.asarray(grouped_rects).reshape(-1, 4).tolist()
+        ]
 
     return rectangles
@@ -4,23 +4,22 @@ import numpy as np
 
 def generate_color_map(num_colors: int = 20):
     """Generate a color map for the segmentation masks"""
-    np.random.seed(42)  # For reproducible colors
+    # For reproducible colors, a private generator yields the same sequence
+    # (saturation then value, color by color) without reseeding np.random
+    random = np.random.RandomState(42).random_sample((num_colors, 2))
 
-    colors = {}
-    for i in range(num_colors):
-        # Generate distinct colors with good visibility
-        # Using HSV color space for better distribution
-        hue = i / num_colors
-        saturation = 0.8 + np.random.random() * 0.2
-        value = 0.8 + np.random.random() * 0.2
+    # Generate distinct colors with good visibility
+    # Using HSV color space for better distribution
+    hue = np.arange(num_colors) / num_colors
+    saturation = 0.8 + random[:, 0] * 0.2
+    value = 0.8 + random[:, 1] * 0.2
+    hsv_colors = np.stack([hue * 180, saturation * 255, value * 255], axis=-1)
 
-        # Convert HSV to BGR (OpenCV uses BGR)
-        hsv_color = np.array(
-            [[[hue * 180, saturation * 255, value * 255]]], dtype=np.uint8
-        )
-        bgr_color = cv2.cvtColor(hsv_color, cv2.COLOR_HSV2BGR)[0][0]
+    # Convert HSV to BGR (OpenCV uses BGR), all colors in one call. The colors
+    # are laid out as a single column, rows one pixel wide go through the same
+    # conversion as the former one pixel images, a wide row takes a vectorized
+    # path that rounds some channels one step differently
+    bgr_colors = cv2.cvtColor(hsv_colors[:, None].astype(np.uint8), cv2.COLOR_HSV2BGR)
 
-        # Store as (B, G, R) tuple
-        colors[i] = (int(bgr_color[0]), int(bgr_color[1]), int(bgr_color[2]))
-
-    return colors
+    # Store as (B, G, R) tuple
+    return {i: tuple(bgr) for i, bgr in enumerate(bgr_colors[:, 0].tolist())}
@@ -1,3 +1,4 @@
+from functools import lru_cache
 
 import cv2
 import numpy as np
@@ -5,6 +6,14 @@ import numpy as np
 from imagebaker.core.defs import PredictionResult
 
 
+@lru_cache(maxsize=256)
+def _text_size(
+    text: str, font_face: int, text_scale: float, text_thickness: int
+) -> tuple[tuple[int, int], int]:
+    """cv2.getTextSize, memoized since the same labels repeat across results."""
+    return cv2.getTextSize(text, font_face, text_scale, text_thickness)
+
+
 def annotate_detection(
     image: np.ndarray,
     results: list[PredictionResult],
@@ -53,7 +62,7 @@ def annotate_detection(
         label_text = f"{class_name}: {score:.2f}"
 
         # Calculate text size to create background rectangle
-        (text_width, text_height), baseline = cv2.getTextSize(
+        (text_width, text_height), baseline = _text_size(
             label_text,
             font_face,
             text_scale,
@@ -98,6 +107,8 @@ def annotate_segmentation(
     """
     annotated_image = image.copy()
     mask_overlay = np.zeros_like(image)
+    # scratch mask shared by all results, cleared before each one is filled
+    mask = np.empty(image.shape[:2], dtype=np.uint8)
 
     for i, result in enumerate(results):
         if (result.polygon is not None) or not result.mask:
@@ -107,27 +118,28 @@ def annotate_segmentation(
         color_idx = i % len(color_map)
         color = color_map[color_idx]
 
-        # Create mask from polygons
-        mask = np.zeros((image.shape[0], image.shape[1]), dtype=np.uint8)
-        for poly in result.polygon:
-            poly_np = np.array(poly, dtype=np.int32).reshape((-1, 1, 2))
+        polys = [
+            np.array(poly, dtype=np.int32).reshape((-1, 1, 2))
+            for poly in result.polygon
+        ]
+
+        # Create mask from polygons, one at a time so overlaps stay filled
+        mask.fill(0)
+        for poly_np in polys:
             cv2.fillPoly(mask, [poly_np], 1)
 
-        # Apply color to mask overlay
-        color_mask = np.zeros_like(image)
-        color_mask[mask == 1] = color
-        mask_overlay = cv2.addWeighted(mask_overlay, 1.0, color_mask, 1.0, 0)
+        # Add the color under the mask in place, saturating like the sum of
+        # full-size color layers did, without building one per result
+        cv2.add(mask_overlay, (*color, 0), dst=mask_overlay, mask=mask)
 
         # Draw contours
-        for poly in result.polygon:
-            poly_np = np.array(poly, dtype=np.int32).reshape((-1, 1, 2))
-            cv2.polylines(
-                annotated_image,
-                [poly_np],
-                True,
-                color,
-                contour_thickness,
-            )
+        cv2.polylines(
+            annotated_image,
+            polys,
+            True,
+            color,
+            contour_thickness,
+        )
 
         # Add label text
         label_position = (
@@ -136,7 +148,7 @@ def annotate_segmentation(
         label_text = f"{result.class_id}: {result.score:.2f}"
 
         # Draw text background
-        (text_width, text_height), baseline = cv2.getTextSize(
+        (text_width, text_height), baseline = _text_size(
             label_text,
             font_face,
             text_scale,
@@ -162,13 +174,14 @@ def annotate_segmentation(
             text_thickness,
         )
 
-    # Blend mask overlay with original image
-    annotated_image = cv2.addWeighted(
+    # Blend mask overlay with original image, writing into the copy made above
+    cv2.addWeighted(
         annotated_image,
         1.0,
         mask_overlay,
         mask_opacity,
         0,
+        dst=annotated_image,
     )
 
     return annotated_image
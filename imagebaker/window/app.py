@@ -1,6 +1,8 @@
 import ast
 import importlib.util
+import os
 import runpy
+from functools import lru_cache
 from pathlib import Path
 
 import typer
@@ -13,6 +15,63 @@ from imagebaker.window.main_window import MainWindow
 app_cli = typer.Typer()
 
 
+def find_and_import_subclasses(
+    file_path: str, base_class_names: set[str]
+) -> dict[str, type]:
+    """
+    Find and import the first subclass of each given base class in a Python file.
+
+    The file is parsed and imported once, however many base classes are asked
+    for. Results are cached until the file is modified.
+
+    Args:
+        file_path (str): The path to the Python file to inspect.
+        base_class_names (set[str]): The names of the base classes to look for
+            subclasses of.
+
+    Returns:
+        dict[str, type]: The first subclass found for each base class name,
+            base classes without a subclass are left out.
+    """
+    path = Path(file_path).resolve()
+    # the modification time is part of the key, so editing the file reloads it
+    return dict(
+        _find_subclasses_cached(
+            str(path), os.stat(path).st_mtime_ns, frozenset(base_class_names)
+        )
+    )
+
+
+@lru_cache(maxsize=32)
+def _find_subclasses_cached(
+    file_path: str, mtime_ns: int, base_class_names: frozenset[str]
+) -> dict[str, type]:
+    with open(file_path) as file:
+        tree = ast.parse(file.read(), filename=file_path)
+
+    # only module level classes can be read back from the module, so there is
+    # no need to walk into function bodies and expressions
+    class_names = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id in base_class_names:
+                class_names.setdefault(base.id, node.name)
+    if not class_names:
+        return {}
+
+    # Dynamically import the file and return the classes
+    module_name = Path(file_path).stem
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {
+        base_name: getattr(module, class_name)
+        for base_name, class_name in class_names.items()
+    }
+
+
 def find_and_import_subclass(file_path: str, base_class_name: str):
     """
     Find and import the first subclass of a given base class in a Python file.
@@ -24,22 +83,9 @@ def find_and_import_subclass(file_path: str, base_class_name: str):
     Returns:
         type: The first subclass found, or None if no subclass is found.
     """
-    with open(file_path) as file:
-        tree = ast.parse(file.read(), filename=file_path)
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            for base in node.bases:
-                if isinstance(base, ast.Name) and base.id == base_class_name:
-                    # Dynamically import the file and return the class
-                    module_name = Path(file_path).stem
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, file_path
-                    )
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    return getattr(module, node.name)
-    return None
+    return find_and_import_subclasses(file_path, {base_class_name}).get(
+        base_class_name
+    )
 
 
 def load_models(file_path: str):
@@ -96,11 +142,13 @@ def run(
         layer_config_class = None
         canvas_config_class = None
     else:
-        # Find and import subclasses of LayerConfig and CanvasConfig
-        layer_config_class = find_and_import_subclass(configs_file_path, "LayerConfig")
-        canvas_config_class = find_and_import_subclass(
-            configs_file_path, "CanvasConfig"
+        # Find and import subclasses of LayerConfig and CanvasConfig, the file
+        # is imported once for both
+        config_classes = find_and_import_subclasses(
+            configs_file_path, {"LayerConfig", "CanvasConfig"}
         )
+        layer_config_class = config_classes.get("LayerConfig")
+        canvas_config_class = config_classes.get("CanvasConfig")
 
     # Use the imported subclass if found, or fall back to the default
     if layer_config_class:
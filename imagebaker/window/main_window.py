@@ -87,6 +87,8 @@ class MainWindow(QMainWindow):
 
     def goto_tab(self, tab_index):
         """Switch to the specified tab index."""
+        if self.tab_widget.currentIndex() == tab_index:
+            return
         self.tab_widget.setCurrentIndex(tab_index)
         self.update_status("Switched to Layerify tab")
 
@@ -210,6 +212,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         logger.info("Closing the application.")
+        self.layerify_tab.shutdown_workers()
         if self.layerify_config.cleanup_on_exit:
             import shutil
 
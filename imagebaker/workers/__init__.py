@@ -1,3 +1,4 @@
 from .layerify_worker import LayerifyWorker  # noqa
 from .baker_worker import BakerWorker  # noqa
 from .model_worker import ModelPredictionWorker  # noqa
+from .preload_worker import PreloaderWorker  # noqa
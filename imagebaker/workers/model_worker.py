@@ -1,10 +1,16 @@
 import traceback
 
 import numpy as np
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImage
 
 from imagebaker import logger
 from imagebaker.models.base_model import BaseModel
+from imagebaker.utils.image import qpixmap_to_numpy
+
+# Prompt inputs are numpy arrays, (values, offsets) pairs for ragged inputs,
+# or plain nested lists
+PromptInput = np.ndarray | tuple[np.ndarray, np.ndarray] | list
 
 
 class ModelPredictionWorker(QObject):
@@ -13,23 +19,30 @@ class ModelPredictionWorker(QObject):
 
     def __init__(
         self,
-        model: BaseModel,
-        image: np.ndarray,
-        points: list[int],
-        polygons: list[list[int]],
-        rectangles: list[list[int]],
-        label_hints: list[int],
+        model: BaseModel | None = None,
+        image: np.ndarray | QImage | None = None,
+        points: PromptInput | None = None,
+        polygons: PromptInput | None = None,
+        rectangles: PromptInput | None = None,
+        label_hints: PromptInput | None = None,
     ):
         """
         A worker that runs the model prediction in a separate thread.
 
+        The worker can either be built for a single job and run through
+        `process`, or kept alive on a thread and fed jobs through `submit`.
+
         Args:
             model (BaseModel): The model to use for prediction.
-            image (np.ndarray): The image to predict on.
-            points (list[int]): The points to predict on.
-            polygons (list[list[int]]): The polygons to predict on.
-            rectangles (list[list[int]]): The rectangles to predict on.
-            label_hints (list[int]): The label hints to use.
+            image (np.ndarray | QImage): The image to predict on.
+            points (PromptInput): The points to predict on, as a
+                (values, offsets) pair from utils.image.qpointlists_to_csr.
+            polygons (PromptInput): The polygons to predict on, in the same
+                (values, offsets) layout as points.
+            rectangles (PromptInput): The rectangles to predict on, an
+                array of shape (1, N, 4) holding x1, y1, x2, y2.
+            label_hints (PromptInput): The label hints to use, an array of
+                shape (N, 1).
         """
         super().__init__()
         self.model = model
@@ -39,14 +52,64 @@ class ModelPredictionWorker(QObject):
         self.rectangles = rectangles
         self.label_hints = label_hints
 
+    @Slot(object, object, object, object, object, object)
+    def submit(
+        self,
+        model: BaseModel,
+        image: np.ndarray | QImage,
+        points: PromptInput | None,
+        polygons: PromptInput | None,
+        rectangles: PromptInput | None,
+        label_hints: PromptInput | None,
+    ):
+        """
+        Run a prediction job on the thread this worker lives on.
+
+        Args:
+            model (BaseModel): The model to use for prediction.
+            image (np.ndarray | QImage): The image to predict on.
+            points (PromptInput | None): The points to predict on.
+            polygons (PromptInput | None): The polygons to predict on.
+            rectangles (PromptInput | None): The rectangles to predict on.
+            label_hints (PromptInput | None): The label hints to use.
+        """
+        self.model = model
+        self.image = image
+        self.points = points
+        self.polygons = polygons
+        self.rectangles = rectangles
+        self.label_hints = label_hints
+        self.process()
+
+    @staticmethod
+    def _as_lists(values):
+        """
+        Turn numpy prompt inputs into the nested lists models expect.
+
+        Ragged inputs such as points and polygons arrive as a (values, offsets)
+        pair, see utils.image.qpointlists_to_csr. Dense inputs arrive as arrays.
+        Plain lists are passed through.
+        """
+        if values is None:
+            return None
+        if isinstance(values, tuple):
+            coords, offsets = values
+            return [chunk.tolist() for chunk in np.split(coords, offsets[1:-1])]
+        if isinstance(values, np.ndarray):
+            return values.tolist()
+        return values
+
     def process(self):
         try:
+            image = self.image
+            if isinstance(image, QImage):
+                image = qpixmap_to_numpy(image)
             result = self.model.predict(
-                self.image,
-                self.points,
-                self.rectangles,
-                self.polygons,
-                self.label_hints,
+                image,
+                self._as_lists(self.points),
+                self._as_lists(self.rectangles),
+                self._as_lists(self.polygons),
+                self._as_lists(self.label_hints),
             )
             self.finished.emit(result)
         except Exception as e:
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtGui import QImage
+
+from imagebaker import logger
+
+
+class PreloaderWorker(QObject):
+    preloaded = Signal(Path, QImage)
+    error = Signal(Path, str)
+
+    def __init__(self):
+        """
+        A worker that decodes images in a separate thread so that navigating
+        to them later is a pixmap handoff instead of a disk read and decode.
+
+        QPixmap is tied to the GUI thread, so the decoded QImage is emitted
+        and converted by the receiver.
+        """
+        super().__init__()
+
+    @Slot(list)
+    def request_preload(self, paths: list[Path]):
+        for path in paths:
+            image = QImage(str(path))
+            if image.isNull():
+                logger.warning(f"Failed to preload image: {path}")
+                self.error.emit(path, f"Failed to decode {path}")
+                continue
+            self.preloaded.emit(path, image)
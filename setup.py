@@ -43,5 +43,8 @@ setuptools.setup(
             "pymdown-extensions>=8.0",
             "mkdocs-awesome-pages-plugin",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
     },
 )
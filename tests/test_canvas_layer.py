@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QThreadPool  # noqa: E402
+from PySide6.QtGui import QColor, QImage  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from imagebaker.core.configs import CanvasConfig  # noqa: E402
+from imagebaker.layers.canvas_layer import CanvasLayer  # noqa: E402
+
+
+@pytest.fixture
+def canvas(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    canvas = CanvasLayer(config=CanvasConfig(project_dir=tmp_path))
+    yield canvas
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+
+def _add_red_layer(canvas):
+    image = QImage(400, 200, QImage.Format_ARGB32)
+    image.fill(QColor(255, 0, 0))
+    layer = CanvasLayer(config=canvas.config)
+    layer.set_image(image)
+    canvas.add_layer(layer)
+    canvas.save_current_state()
+
+
+def _finish_renders():
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+def test_state_thumbnail_is_rendered_in_the_background(canvas):
+    _add_red_layer(canvas)
+    step = next(iter(canvas.states))
+    available = []
+    canvas.thumbnailsAvailable.connect(available.append)
+
+    assert canvas.render_state_thumbnail(step)
+    _finish_renders()
+
+    assert available == [step]
+    thumbnail = canvas.state_thumbnail[step]
+    assert not thumbnail.isNull()
+    width, height = canvas.config.normal_draw_config.thumbnail_size
+    assert thumbnail.width() <= width and thumbnail.height() <= height
+    center = thumbnail.pixelColor(thumbnail.width() // 2, thumbnail.height() // 2)
+    assert center.red() == 255 and center.green() == 0
+
+
+def test_state_thumbnail_of_replaced_states_is_dropped(canvas):
+    _add_red_layer(canvas)
+    step = next(iter(canvas.states))
+
+    assert canvas.render_state_thumbnail(step)
+    canvas.states[step] = list(canvas.states[step])
+    _finish_renders()
+
+    assert step not in canvas.state_thumbnail
@@ -0,0 +1,40 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QPointF, QRectF  # noqa: E402
+from PySide6.QtGui import QPolygonF  # noqa: E402
+
+from imagebaker.core.defs import Annotation  # noqa: E402
+
+
+def test_polygon_array_is_reused_until_polygon_is_assigned():
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 1",
+        polygon=QPolygonF([QPointF(0, 0), QPointF(4, 0), QPointF(4, 3)]),
+    )
+    first = annotation.polygon_array()
+    assert annotation.polygon_array() is first
+
+    annotation.polygon = QPolygonF([QPointF(1, 1), QPointF(5, 1), QPointF(5, 4)])
+
+    assert annotation.polygon_array().tolist() == [[1, 1], [5, 1], [5, 4]]
+
+
+def test_geometry_changed_drops_arrays_after_in_place_edits():
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 1",
+        points=[QPointF(2, 3)],
+        rectangle=QRectF(0, 0, 10, 20),
+    )
+    assert annotation.points_array().tolist() == [[2, 3]]
+    assert annotation.rectangle_xyxy().tolist() == [0, 0, 10, 20]
+
+    annotation.points[0] = QPointF(7, 8)
+    annotation.rectangle.translate(QPointF(1, 1))
+    annotation.geometry_changed()
+
+    assert annotation.points_array().tolist() == [[7, 8]]
+    assert annotation.rectangle_xyxy().tolist() == [1, 1, 11, 21]
@@ -0,0 +1,156 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QEvent, QRectF, Qt  # noqa: E402
+from PySide6.QtGui import QColor, QImage, QKeyEvent  # noqa: E402
+from PySide6.QtWidgets import QApplication, QMainWindow  # noqa: E402
+
+from imagebaker.core.configs import CanvasConfig, LayerConfig  # noqa: E402
+from imagebaker.core.defs import Annotation  # noqa: E402
+from imagebaker.tabs.layerify_tab import LayerifyTab, _iter_images  # noqa: E402
+
+
+@pytest.fixture
+def paged_tab(tmp_path):
+    # more images than fit on one page of the image list
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    image = QImage(32, 32, QImage.Format_RGB32)
+    image.fill(QColor(0, 0, 255))
+    for index in range(12):
+        assert image.save(str(assets / f"image_{index:02d}.png"))
+    yield from tab.__wrapped__(tmp_path)
+
+
+@pytest.fixture
+def tab(tmp_path):
+    app = QApplication.instance() or QApplication([])
+    window = QMainWindow()
+    tab = LayerifyTab(
+        window,
+        LayerConfig(project_dir=tmp_path),
+        CanvasConfig(project_dir=tmp_path),
+        {None: None},
+    )
+    yield tab
+    tab.shutdown_workers()
+    window.close()
+    app.processEvents()
+
+
+def test_digit_key_relabels_selected_annotation(tab):
+    # the layer's current label is "Label 1"
+    tab.handle_label_change(1)
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 2",
+        color=QColor(0, 255, 0),
+        rectangle=QRectF(0, 0, 10, 10),
+        is_complete=True,
+        selected=True,
+    )
+    tab.layer.annotations.append(annotation)
+    # selecting the annotation moves the combo to its label only
+    tab.sync_label_combo_to_selection()
+    assert tab.label_combo.currentText() == "Label 2"
+
+    tab.keyPressEvent(QKeyEvent(QEvent.KeyPress, Qt.Key_1, Qt.NoModifier))
+
+    assert annotation.label == "Label 1"
+    assert annotation.color == QColor(255, 0, 0)
+    assert tab.label_combo.currentText() == "Label 1"
+
+
+def test_digit_key_for_applied_label_keeps_annotation(tab):
+    tab.handle_label_change(2)
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 2",
+        color=QColor(0, 255, 0),
+        rectangle=QRectF(0, 0, 10, 10),
+        is_complete=True,
+        selected=True,
+    )
+    tab.layer.annotations.append(annotation)
+    tab.sync_label_combo_to_selection()
+
+    tab.keyPressEvent(QKeyEvent(QEvent.KeyPress, Qt.Key_2, Qt.NoModifier))
+
+    assert annotation.label == "Label 2"
+    assert tab.label_combo.currentText() == "Label 2"
+
+
+def test_autorepeat_of_unhandled_key_falls_through(tab):
+    tab.keyPressEvent(QKeyEvent(QEvent.KeyPress, Qt.Key_Down, Qt.NoModifier))
+    repeat = QKeyEvent(QEvent.KeyPress, Qt.Key_Down, Qt.NoModifier, autorep=True)
+    repeat.ignore()
+
+    tab.keyPressEvent(repeat)
+
+    # QWidget.keyPressEvent ignores keys it does not use, so the repeat reaches
+    # the parent instead of being swallowed by the tab
+    assert not repeat.isAccepted()
+
+
+def test_autorepeat_of_shortcut_key_is_swallowed(tab):
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 1",
+        rectangle=QRectF(0, 0, 10, 10),
+        is_complete=True,
+        selected=True,
+    )
+    tab.layer.annotations.append(annotation)
+    tab.keyPressEvent(QKeyEvent(QEvent.KeyPress, Qt.Key_H, Qt.NoModifier))
+    assert not annotation.visible
+    repeat = QKeyEvent(QEvent.KeyPress, Qt.Key_H, Qt.NoModifier, autorep=True)
+
+    tab.keyPressEvent(repeat)
+
+    assert repeat.isAccepted()
+    assert not annotation.visible
+
+
+def test_iter_images_skips_hidden_files(tmp_path):
+    for name in ("a.png", "B.JPG", ".png", "._a.jpg", "notes.txt", "png"):
+        (tmp_path / name).touch()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "c.jpeg").touch()
+
+    found = {path.name for path in _iter_images(tmp_path)}
+    assert found == {"a.png", "B.JPG"}
+
+    found = {path.name for path in _iter_images(tmp_path, recursive=True)}
+    assert found == {"a.png", "B.JPG", "c.jpeg"}
+
+
+def test_edit_survives_paging_before_the_save_is_written(paged_tab):
+    tab = paged_tab
+    # share the entries with the panel like select_folder does
+    tab.image_list_panel.image_entries = tab.image_entries
+    layer = tab.layer
+    first_image = layer.file_path
+    annotation = Annotation(
+        annotation_id=0,
+        label="Label 1",
+        rectangle=QRectF(0, 0, 10, 10),
+        is_complete=True,
+        file_path=first_image,
+    )
+    layer.annotations.append(annotation)
+    tab.on_annotation_added(annotation)
+    assert tab._save_timer.isActive()
+
+    # page away and back while the debounced save is still pending
+    tab.image_list_panel.show_next_page()
+    assert tab.layer.file_path != first_image
+    tab.image_list_panel.show_prev_page()
+
+    assert tab.layer.file_path == first_image
+    assert [ann.label for ann in tab.layer.annotations] == ["Label 1"]
+    tab._wait_for_saves()
+    assert tab._cache_path_for_file(first_image).exists()
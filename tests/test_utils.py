@@ -0,0 +1,27 @@
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from imagebaker.utils.utils import generate_color_map  # noqa: E402
+
+
+def _color_map_loop(num_colors):
+    # the per color implementation generate_color_map has to reproduce
+    np.random.seed(42)
+    colors = {}
+    for i in range(num_colors):
+        hue = i / num_colors
+        saturation = 0.8 + np.random.random() * 0.2
+        value = 0.8 + np.random.random() * 0.2
+        hsv_color = np.array(
+            [[[hue * 180, saturation * 255, value * 255]]], dtype=np.uint8
+        )
+        bgr_color = cv2.cvtColor(hsv_color, cv2.COLOR_HSV2BGR)[0][0]
+        colors[i] = (int(bgr_color[0]), int(bgr_color[1]), int(bgr_color[2]))
+    return colors
+
+
+@pytest.mark.parametrize("num_colors", [1, 20, 37, 64, 257])
+def test_generate_color_map_matches_per_color_loop(num_colors):
+    assert generate_color_map(num_colors) == _color_map_loop(num_colors)